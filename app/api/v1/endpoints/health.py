@@ -2,7 +2,7 @@
 Health check endpoints.
 """
 from app.core.logging_config import get_logger
-from datetime import datetime
+from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
@@ -15,6 +15,21 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Static for the lifetime of the process
+APP_VERSION = settings.app_version
+
+# Invariant fields of the health/readiness failure details
+_UNHEALTHY_TEMPLATE = {
+    "status": "unhealthy",
+    "version": APP_VERSION,
+    "dependencies": {},
+}
+_NOT_READY_TEMPLATE = {
+    "ready": False,
+    "checks": {},
+}
+_now = datetime.now
+
 
 @router.get(
     "/health",
@@ -49,45 +64,44 @@ async def health_check(
         # Get comprehensive health status
         health_data = await health_service.check_overall_health()
         
-        # Determine HTTP status based on health
-        http_status = (
-            status.HTTP_200_OK 
-            if health_data["status"] == "healthy" 
-            else status.HTTP_503_SERVICE_UNAVAILABLE
-        )
+        dependencies = {
+            service_name: service_data["status"]
+            for service_name, service_data in health_data["services"].items()
+        }
+        
+        if health_data["status"] != "healthy":
+            logger.warning("Health check failed: %s", health_data)
+            # Build the error detail from the raw data, skipping model validation
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={
+                    "status": health_data["status"],
+                    "timestamp": health_data["timestamp"].isoformat(),
+                    "version": APP_VERSION,
+                    "dependencies": dependencies
+                }
+            )
         
         # Create response
         response = HealthResponse(
             status=health_data["status"],
-            timestamp=datetime.fromisoformat(health_data["timestamp"].replace('Z', '+00:00')),
-            version=settings.app_version,
-            dependencies={
-                service_name: service_data["status"]
-                for service_name, service_data in health_data["services"].items()
-            }
+            timestamp=health_data["timestamp"],
+            version=APP_VERSION,
+            dependencies=dependencies
         )
         
-        if http_status != status.HTTP_200_OK:
-            logger.warning(f"Health check failed: {health_data}")
-            raise HTTPException(
-                status_code=http_status,
-                detail=response.dict()
-            )
-        
         logger.debug("Health check passed")
         return response
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Health check error: {e}")
+        logger.error("Health check error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={
-                "status": "unhealthy",
-                "timestamp": datetime.utcnow().isoformat(),
-                "version": settings.app_version,
-                "dependencies": {},
+                **_UNHEALTHY_TEMPLATE,
+                "timestamp": _now(timezone.utc).isoformat(),
                 "error": str(e)
             }
         )
@@ -125,7 +139,7 @@ async def readiness_check(
         readiness_data = await health_service.check_readiness()
         
         if not readiness_data["ready"]:
-            logger.warning(f"Readiness check failed: {readiness_data}")
+            logger.warning("Readiness check failed: %s", readiness_data)
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail=readiness_data
@@ -137,13 +151,12 @@ async def readiness_check(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Readiness check error: {e}")
+        logger.error("Readiness check error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={
-                "ready": False,
-                "timestamp": datetime.utcnow().isoformat(),
-                "error": str(e),
-                "checks": {}
+                **_NOT_READY_TEMPLATE,
+                "timestamp": _now(timezone.utc).isoformat(),
+                "error": str(e)
             }
         )
\ No newline at end of file
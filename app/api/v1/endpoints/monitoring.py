@@ -8,13 +8,13 @@ This module provides endpoints for:
 - Operational insights
 """
 
-import psutil
+import asyncio
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.core.logging_config import performance_metrics, get_logger
 from app.core.config import settings
@@ -26,6 +26,26 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Static for the lifetime of the process
+APP_VERSION = settings.app_version
+METRICS_CACHE_TTL_SECONDS = settings.metrics_cache_ttl_seconds
+
+# Monotonic application start time, immune to wall-clock adjustments
+_START_TIME = time.monotonic()
+
+# psutil module and current-process handle, imported lazily on first sample
+_psutil = None
+_process = None
+
+# Cached system metrics as (monotonic timestamp, metrics dict)
+_system_metrics_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+# Disk usage is sampled in the background: statvfs can block for seconds
+# on a busy filesystem, so it never runs on the request path
+DISK_USAGE_REFRESH_SECONDS = 30.0
+_disk_usage: Optional[Dict[str, Any]] = None
+_disk_usage_task: Optional[asyncio.Task] = None
+
 
 @router.get(
     "/metrics",
@@ -65,7 +85,7 @@ async def get_metrics(
         # Create response
         response = MetricsResponse(
             timestamp=datetime.utcnow(),
-            uptime_seconds=time.time() - _get_start_time(),
+            uptime_seconds=time.monotonic() - _START_TIME,
             requests=metrics_data["requests"],
             response_times=metrics_data["response_times"],
             errors=metrics_data["errors"],
@@ -131,8 +151,8 @@ async def get_system_health(
         response = SystemHealthResponse(
             timestamp=datetime.utcnow(),
             status=health_data["status"],
-            version=settings.app_version,
-            uptime_seconds=time.time() - _get_start_time(),
+            version=APP_VERSION,
+            uptime_seconds=time.monotonic() - _START_TIME,
             dependencies=health_data["services"],
             system_resources=system_metrics,
             performance_summary={
@@ -169,7 +189,7 @@ async def get_system_health(
         500: {"description": "Internal server error"},
     }
 )
-async def reset_metrics() -> JSONResponse:
+async def reset_metrics() -> ORJSONResponse:
     """
     Reset all performance metrics.
     
@@ -193,7 +213,7 @@ async def reset_metrics() -> JSONResponse:
             "previous_total_errors": current_metrics["errors"]["total"]
         })
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content={
                 "message": "Performance metrics reset successfully",
@@ -216,24 +236,123 @@ async def reset_metrics() -> JSONResponse:
         )
 
 
+def _get_psutil():
+    """
+    Import psutil on first use and cache the module.
+    
+    Returns:
+        The psutil module
+    """
+    global _psutil, _process
+    if _psutil is None:
+        import psutil
+        _process = psutil.Process()
+        _psutil = psutil
+    return _psutil
+
+
+def start_system_metrics_sampling() -> None:
+    """
+    Prime the CPU usage sampler and start the background disk usage sampler.
+    
+    psutil.cpu_percent(interval=None) reports usage since the previous call,
+    so the first call establishes the baseline. Called once at startup.
+    """
+    global _disk_usage_task
+    
+    try:
+        _get_psutil().cpu_percent(interval=None)
+    except Exception as e:
+        logger.warning("Failed to prime system metrics", extra={
+            "error": str(e)
+        })
+    
+    if _disk_usage_task is None:
+        _disk_usage_task = asyncio.create_task(_refresh_disk_usage())
+
+
+async def stop_system_metrics_sampling() -> None:
+    """Stop the background disk usage sampler. Called once at shutdown."""
+    global _disk_usage_task
+    
+    if _disk_usage_task is not None:
+        _disk_usage_task.cancel()
+        try:
+            await _disk_usage_task
+        except asyncio.CancelledError:
+            pass
+        _disk_usage_task = None
+
+
+def _sample_disk_usage() -> Dict[str, Any]:
+    """
+    Read disk usage for the root filesystem.
+    
+    Returns:
+        Dictionary with disk metrics
+    """
+    disk = _get_psutil().disk_usage('/')
+    return {
+        "total_bytes": disk.total,
+        "free_bytes": disk.free,
+        "used_bytes": disk.used,
+        "usage_percent": (disk.used / disk.total) * 100
+    }
+
+
+async def _refresh_disk_usage() -> None:
+    """Periodically refresh the disk usage snapshot in a worker thread."""
+    global _disk_usage
+    
+    while True:
+        try:
+            _disk_usage = await asyncio.to_thread(_sample_disk_usage)
+        except Exception as e:
+            logger.warning("Failed to sample disk usage", extra={
+                "error": str(e)
+            })
+        await asyncio.sleep(DISK_USAGE_REFRESH_SECONDS)
+
+
 def _get_system_metrics() -> Dict[str, Any]:
     """
-    Get current system resource metrics.
+    Get system resource metrics, cached for metrics_cache_ttl_seconds.
+    
+    Returns:
+        Dictionary with system metrics
+    """
+    global _system_metrics_cache
+    
+    now = time.monotonic()
+    if (
+        _system_metrics_cache is not None
+        and now - _system_metrics_cache[0] < METRICS_CACHE_TTL_SECONDS
+    ):
+        return _system_metrics_cache[1]
+    
+    metrics = _collect_system_metrics()
+    if metrics:
+        _system_metrics_cache = (now, metrics)
+    return metrics
+
+
+def _collect_system_metrics() -> Dict[str, Any]:
+    """
+    Collect current system resource metrics.
     
     Returns:
         Dictionary with system metrics
     """
     try:
-        # CPU metrics
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        psutil = _get_psutil()
+        
+        # CPU metrics (non-blocking, usage since the previous sample)
+        cpu_percent = psutil.cpu_percent(interval=None)
         cpu_count = psutil.cpu_count()
         
         # Memory metrics
         memory = psutil.virtual_memory()
         
-        # Disk metrics
-        disk = psutil.disk_usage('/')
-        
         # Network metrics (if available)
         try:
             network = psutil.net_io_counters()
@@ -246,6 +365,26 @@ def _get_system_metrics() -> Dict[str, Any]:
         except Exception:
             network_stats = None
         
+        # Process metrics, batched into a single /proc read
+        try:
+            with _process.oneshot():
+                cpu_times = _process.cpu_times()
+                memory_info = _process.memory_info()
+                num_threads = _process.num_threads()
+                ctx_switches = _process.num_ctx_switches()
+            process_stats = {
+                "pid": _process.pid,
+                "cpu_user_seconds": cpu_times.user,
+                "cpu_system_seconds": cpu_times.system,
+                "rss_bytes": memory_info.rss,
+                "vms_bytes": memory_info.vms,
+                "num_threads": num_threads,
+                "ctx_switches_voluntary": ctx_switches.voluntary,
+                "ctx_switches_involuntary": ctx_switches.involuntary
+            }
+        except Exception:
+            process_stats = None
+        
         return {
             "cpu": {
                 "usage_percent": cpu_percent,
@@ -257,13 +396,9 @@ def _get_system_metrics() -> Dict[str, Any]:
                 "used_bytes": memory.used,
                 "usage_percent": memory.percent
             },
-            "disk": {
-                "total_bytes": disk.total,
-                "free_bytes": disk.free,
-                "used_bytes": disk.used,
-                "usage_percent": (disk.used / disk.total) * 100
-            },
-            "network": network_stats
+            "disk": _disk_usage,
+            "network": network_stats,
+            "process": process_stats
         }
         
     except Exception as e:
@@ -273,20 +408,6 @@ def _get_system_metrics() -> Dict[str, Any]:
         return {}
 
 
-def _get_start_time() -> float:
-    """
-    Get application start time.
-    
-    Returns:
-        Start time as timestamp
-    """
-    # This is a simple implementation - in production you might want to
-    # store this in a more persistent way
-    if not hasattr(_get_start_time, '_start_time'):
-        _get_start_time._start_time = time.time()
-    return _get_start_time._start_time
-
-
 def _calculate_requests_per_minute(metrics: Dict[str, Any]) -> float:
     """
     Calculate requests per minute based on current metrics.
@@ -297,7 +418,7 @@ def _calculate_requests_per_minute(metrics: Dict[str, Any]) -> float:
     Returns:
         Requests per minute
     """
-    uptime_minutes = (time.time() - _get_start_time()) / 60
+    uptime_minutes = (time.monotonic() - _START_TIME) / 60
     if uptime_minutes > 0:
         return metrics["requests"]["total"] / uptime_minutes
     return 0.0
\ No newline at end of file
@@ -2,29 +2,65 @@
 Session management endpoints.
 """
 from app.core.logging_config import get_logger
-import uuid
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 
-from app.models.requests import AudioUpdateRequest
 from app.models.responses import AudioUpdateResponse, ErrorResponse
 from app.services.session_service import SessionService
-from app.core.exceptions import SessionNotFoundError, SessionValidationError
-from app.core.dependencies import get_session_service, get_request_id
+from app.core.exceptions import SessionNotFoundError, SessionValidationError, AudioValidationError
+from app.core.config import settings
+from app.core.dependencies import get_session_service, get_audio_service, get_request_id
+
+if TYPE_CHECKING:
+    # Resolved lazily by get_audio_service to keep app import light
+    from app.services.audio_service import AudioService
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Chunk size used when reading uploaded audio from the spooled temp file
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def _read_upload(upload: UploadFile, max_bytes: int) -> bytes:
+    """
+    Read an uploaded file in chunks, enforcing the maximum audio size.
+    
+    Args:
+        upload: Uploaded audio file
+        max_bytes: Maximum allowed size in bytes
+        
+    Returns:
+        Raw file bytes
+        
+    Raises:
+        AudioValidationError: If the upload exceeds max_bytes
+    """
+    chunks = []
+    total = 0
+    while True:
+        chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > max_bytes:
+            raise AudioValidationError(
+                f"Audio file too large: exceeds {max_bytes} bytes",
+                {"max_bytes": max_bytes}
+            )
+        chunks.append(chunk)
+    return b"".join(chunks)
+
 
 @router.put(
     "/{session_id}/audio",
     response_model=AudioUpdateResponse,
     status_code=status.HTTP_200_OK,
     summary="Update session by transcribing new audio",
-    description="Transcribe new base64-encoded audio and update the session's speech content",
+    description="Transcribe an uploaded audio file and update the session's speech content",
     responses={
         200: {"description": "Audio update successful"},
         404: {"description": "Session not found", "model": ErrorResponse},
@@ -35,23 +71,26 @@ router = APIRouter()
 )
 async def update_session_audio(
     session_id: int,
-    request: AudioUpdateRequest,
+    audio: UploadFile = File(..., description="Audio file (WAV, MP3, FLAC, M4A, OGG, WebM)"),
     session_service: SessionService = Depends(get_session_service),
-    request_id: Optional[str] = Depends(get_request_id)
+    audio_service: "AudioService" = Depends(get_audio_service),
+    request_id: str = Depends(get_request_id)
 ) -> AudioUpdateResponse:
     """
     Update the audio data for an existing session by transcribing new audio.
     
     This endpoint allows clients to replace or correct audio recordings
-    without creating new sessions. The audio data must be base64-encoded
-    and in a supported format (WAV, MP3, FLAC, M4A, OGG, WebM).
+    without creating new sessions. The audio is uploaded as a
+    multipart/form-data file and must be in a supported format
+    (WAV, MP3, FLAC, M4A, OGG, WebM).
     The audio will be transcribed using OpenAI Whisper and the transcribed
     text will be stored in the session.
     
     Args:
         session_id: ID of the session to update
-        request: Request containing new base64-encoded audio data
+        audio: Uploaded audio file
         session_service: Injected session service
+        audio_service: Injected audio service
         
     Returns:
         AudioUpdateResponse with confirmation and timestamp
@@ -59,17 +98,17 @@ async def update_session_audio(
     Raises:
         HTTPException: Various HTTP errors based on failure type
     """
-    if not request_id:
-        request_id = str(uuid.uuid4())
+    logger.info("Starting audio transcription and update for session %s (request: %s)", session_id, request_id)
     
-    logger.info(f"Starting audio transcription and update for session {session_id} (request: {request_id})")
+    audio_bytes = await _read_upload(audio, settings.max_audio_size_mb * 1024 * 1024)
     
     # Transcribe audio and update session
     updated_session = await session_service.update_session_with_audio_transcription(
         session_id, 
-        request.audio
+        audio_bytes,
+        audio_service=audio_service
     )
-    logger.info(f"Successfully transcribed and updated session {session_id}")
+    logger.info("Successfully transcribed and updated session %s", session_id)
     
     # Create response
     response = AudioUpdateResponse(
@@ -78,5 +117,5 @@ async def update_session_audio(
         updated_at=datetime.utcnow()
     )
     
-    logger.info(f"Audio transcription and update completed for session {session_id}")
+    logger.info("Audio transcription and update completed for session %s", session_id)
     return response
\ No newline at end of file
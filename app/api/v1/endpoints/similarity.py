@@ -2,9 +2,10 @@
 Similarity calculation endpoints.
 """
 from app.core.logging_config import get_logger
-import uuid
+import asyncio
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
@@ -12,8 +13,6 @@ from fastapi.responses import JSONResponse
 from app.models.requests import SimilarityRequest
 from app.models.responses import SimilarityResponse, ErrorResponse
 from app.services.session_service import SessionService
-from app.services.embedding_service import EmbeddingService
-from app.services.similarity_service import SimilarityService
 from app.core.exceptions import (
     SessionNotFoundError,
     SessionValidationError,
@@ -25,7 +24,17 @@ from app.core.exceptions import (
     DatabaseError,
     DatabaseConnectionError
 )
-from app.core.dependencies import get_session_service, get_embedding_service, get_request_id
+from app.core.dependencies import (
+    get_session_service,
+    get_embedding_service,
+    get_similarity_service,
+    get_request_id
+)
+
+if TYPE_CHECKING:
+    # Resolved lazily by the dependency factories to keep app import light
+    from app.services.embedding_service import EmbeddingService
+    from app.services.similarity_service import SimilarityService
 
 logger = get_logger(__name__)
 
@@ -51,8 +60,9 @@ async def calculate_similarity(
     session_id: int,
     request: SimilarityRequest,
     session_service: SessionService = Depends(get_session_service),
-    embedding_service: EmbeddingService = Depends(get_embedding_service),
-    request_id: Optional[str] = Depends(get_request_id)
+    embedding_service: "EmbeddingService" = Depends(get_embedding_service),
+    similarity_service: "SimilarityService" = Depends(get_similarity_service),
+    request_id: str = Depends(get_request_id)
 ) -> SimilarityResponse:
     """
     Calculate similarity between session audio transcription and reference text.
@@ -75,48 +85,51 @@ async def calculate_similarity(
     Raises:
         HTTPException: Various HTTP errors based on failure type
     """
-    if not request_id:
-        request_id = str(uuid.uuid4())
-    start_time = datetime.utcnow()
+    start_ns = time.monotonic_ns()
     
-    logger.info(f"Starting similarity calculation for session {session_id} (request: {request_id})")
+    logger.info("Starting similarity calculation for session %s (request: %s)", session_id, request_id)
     
-    # Step 1: Retrieve session data
-    session_record = await session_service.get_session(session_id)
-    logger.info(f"Retrieved session {session_id} successfully")
-    
-    # Step 2: Use stored transcribed text (no audio processing needed)
-    transcribed_text = session_record.audio
-    logger.info(f"Using stored transcribed text for session {session_id}")
+    # Start the reference embedding (independent of the session) right away
+    reference_task = asyncio.create_task(
+        embedding_service.get_reference_embedding(request.reference_text)
+    )
     
-    # Step 3: Generate embeddings using injected service
     try:
-        # Generate embeddings for both texts in batch for efficiency
-        embedding_results = await embedding_service.get_embeddings_batch([
-            transcribed_text,
-            request.reference_text
-        ])
+        # Step 1: Retrieve session data
+        session_record = await session_service.get_session(session_id)
+        logger.info("Retrieved session %s successfully", session_id)
         
-        transcribed_embedding = embedding_results[0]
-        reference_embedding = embedding_results[1]
+        # Step 2: Use stored transcribed text (no audio processing needed)
+        transcribed_text = session_record.audio
+        logger.info("Using stored transcribed text for session %s", session_id)
         
-        logger.info(f"Generated embeddings for session {session_id}")
-    except Exception as e:
-        logger.error(f"Embedding generation failed for session {session_id}: {e}")
-        raise
+        # Step 3: Generate embeddings using injected service
+        try:
+            transcribed_embedding = await embedding_service.get_embedding(transcribed_text)
+            reference_embedding = await reference_task
+            
+            logger.info("Generated embeddings for session %s", session_id)
+        except Exception as e:
+            logger.error("Embedding generation failed for session %s: %s", session_id, e)
+            raise
+    finally:
+        if not reference_task.done():
+            reference_task.cancel()
+        elif not reference_task.cancelled():
+            # Mark a failed task's exception as retrieved when we bailed out early
+            reference_task.exception()
     
     # Step 4: Calculate similarity
-    similarity_service = SimilarityService()
     similarity_result = similarity_service.calculate_similarity(
-        transcribed_embedding.vector,
-        reference_embedding.vector
+        transcribed_embedding.to_numpy(),
+        reference_embedding.to_numpy(),
+        norm2=reference_embedding.l2_norm()
     )
     similarity_score = similarity_result.normalized_score
-    logger.info(f"Calculated similarity score {similarity_score:.4f} for session {session_id}")
+    logger.info("Calculated similarity score %.4f for session %s", similarity_score, session_id)
     
     # Calculate processing time
-    end_time = datetime.utcnow()
-    processing_time_ms = int((end_time - start_time).total_seconds() * 1000)
+    processing_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     # Create response
     response = SimilarityResponse(
@@ -125,8 +138,8 @@ async def calculate_similarity(
         transcribed_text=transcribed_text,
         similarity_score=similarity_score,
         processing_time_ms=processing_time_ms,
-        timestamp=end_time
+        timestamp=datetime.utcnow()
     )
     
-    logger.info(f"Similarity calculation completed for session {session_id} in {processing_time_ms}ms")
+    logger.info("Similarity calculation completed for session %s in %sms", session_id, processing_time_ms)
     return response
\ No newline at end of file
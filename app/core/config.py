@@ -16,6 +16,16 @@ class Settings(BaseSettings):
     
     # Database - Supabase Session Pooler
     supabase_pooler_connection_string: str = Field(..., env="SUPABASE_POOLER_CONNECTION_STRING")
+    db_pool_min_size: int = Field(default=5, env="DB_POOL_MIN_SIZE")
+    db_pool_max_size: int = Field(default=5, env="DB_POOL_MAX_SIZE")  # Kept small for Render's resource limits
+    db_pool_max_queries: int = Field(default=50000, env="DB_POOL_MAX_QUERIES")
+    db_pool_max_inactive_connection_lifetime: float = Field(default=300.0, env="DB_POOL_MAX_INACTIVE_CONNECTION_LIFETIME")
+    # None = auto: disabled behind the transaction pooler (port 6543), which
+    # can't hold prepared statements; 1024 for session-mode/direct connections
+    db_statement_cache_size: Optional[int] = Field(default=None, env="DB_STATEMENT_CACHE_SIZE")
+    db_health_check_timeout: float = Field(default=5.0, env="DB_HEALTH_CHECK_TIMEOUT")
+    db_health_check_ttl_seconds: float = Field(default=5.0, env="DB_HEALTH_CHECK_TTL_SECONDS")
+    db_cursor_prefetch: int = Field(default=200, env="DB_CURSOR_PREFETCH")
     
     # OpenAI
     openai_api_key: str = Field(..., env="OPENAI_API_KEY")
@@ -23,6 +33,7 @@ class Settings(BaseSettings):
     
     # Performance and limits
     max_audio_size_mb: int = Field(default=25, env="MAX_AUDIO_SIZE_MB")
+    metrics_cache_ttl_seconds: float = Field(default=10.0, env="METRICS_CACHE_TTL_SECONDS")
     
     # Security
     cors_origins: str = Field(default="*", env="CORS_ORIGINS")
@@ -30,6 +41,7 @@ class Settings(BaseSettings):
     # Logging and monitoring
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     structured_logging: bool = Field(default=True, env="STRUCTURED_LOGGING")
+    metrics_enabled: bool = Field(default=True, env="METRICS_ENABLED")
     
     class Config:
         env_file = ".env"
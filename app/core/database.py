@@ -2,13 +2,59 @@
 Database connection and client configuration for Supabase Session Pooler.
 """
 from app.core.logging_config import get_logger
-from typing import Optional
+from typing import AsyncIterator, Optional
 import asyncpg
 import asyncio
+import orjson
+import time
 from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
 
 logger = get_logger(__name__)
 
+# Supabase's transaction-mode pooler (pgbouncer) port; a connection may be
+# handed to another client between statements, so prepared statements break
+TRANSACTION_POOLER_PORT = 6543
+DEFAULT_STATEMENT_CACHE_SIZE = 1024
+
+
+def _encode_json(value) -> str:
+    """Encode a Python value for a json/jsonb parameter."""
+    return orjson.dumps(value).decode()
+
+
+def _statement_cache_size(dsn: str, configured: Optional[int]) -> int:
+    """
+    Resolve asyncpg's statement_cache_size for a DSN.
+    
+    An explicit setting wins; otherwise the cache is disabled for the
+    transaction pooler and enabled for session-mode or direct connections.
+    """
+    if configured is not None:
+        return configured
+    try:
+        port = urlsplit(dsn).port
+    except ValueError:
+        port = None
+    return 0 if port == TRANSACTION_POOLER_PORT else DEFAULT_STATEMENT_CACHE_SIZE
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """
+    Per-connection setup run by the pool.
+    
+    Registers orjson codecs for json/jsonb so JSON columns come back as
+    Python objects and parameters can be passed without pre-serializing.
+    """
+    for type_name in ('json', 'jsonb'):
+        await conn.set_type_codec(
+            type_name,
+            encoder=_encode_json,
+            decoder=orjson.loads,
+            schema='pg_catalog',
+            format='text'
+        )
+
 
 class DatabaseClient:
     """Supabase session pooler database client with connection pooling."""
@@ -16,6 +62,8 @@ class DatabaseClient:
     def __init__(self):
         self._pool: Optional[asyncpg.Pool] = None
         self._is_connected = False
+        self._last_health_ts: Optional[float] = None
+        self._last_health_ok = False
     
     async def get_pool(self) -> asyncpg.Pool:
         """Get or create connection pool."""
@@ -32,14 +80,21 @@ class DatabaseClient:
         
         for attempt in range(max_retries):
             try:
-                logger.info(f"Attempting database connection (attempt {attempt + 1}/{max_retries})")
+                logger.info("Attempting database connection (attempt %s/%s)", attempt + 1, max_retries)
                 
                 # Create connection pool with session pooler connection string
                 pool = await asyncpg.create_pool(
                     dsn=settings.supabase_pooler_connection_string,
-                    min_size=1,
-                    max_size=5,  # Reduced for Render's resource limits
+                    min_size=settings.db_pool_min_size,  # Pre-warmed connections
+                    max_size=settings.db_pool_max_size,
+                    max_queries=settings.db_pool_max_queries,
+                    max_inactive_connection_lifetime=settings.db_pool_max_inactive_connection_lifetime,
+                    statement_cache_size=_statement_cache_size(
+                        settings.supabase_pooler_connection_string,
+                        settings.db_statement_cache_size
+                    ),
                     command_timeout=30,  # Reduced timeout
+                    init=_init_connection,
                     server_settings={
                         'jit': 'off'  # Disable JIT for better performance with pooling
                     }
@@ -54,9 +109,9 @@ class DatabaseClient:
                 return pool
                 
             except Exception as e:
-                logger.error(f"Failed to create connection pool (attempt {attempt + 1}): {e}")
+                logger.error("Failed to create connection pool (attempt %s): %s", attempt + 1, e)
                 if attempt < max_retries - 1:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
+                    logger.info("Retrying in %s seconds...", retry_delay)
                     await asyncio.sleep(retry_delay)
                     retry_delay *= 2  # Exponential backoff
                 else:
@@ -71,26 +126,94 @@ class DatabaseClient:
             yield connection
     
     async def execute_query(self, query: str, *args):
-        """Execute a query and return results."""
+        """
+        Execute a query and return results.
+        
+        Uses the pool's one-shot fetch, which acquires and releases the
+        connection itself; when the statement cache is enabled (see
+        _statement_cache_size), repeated query text reuses prepared statements.
+        """
+        pool = await self.get_pool()
+        return await pool.fetch(query, *args)
+    
+    async def execute_fetchval(self, query: str, *args):
+        """
+        Execute a query and return the first column of the first row.
+        
+        Avoids building Record objects when only a single value is needed.
+        """
+        pool = await self.get_pool()
+        return await pool.fetchval(query, *args)
+    
+    async def iter_query(
+        self,
+        query: str,
+        *args,
+        prefetch: Optional[int] = None
+    ) -> AsyncIterator[asyncpg.Record]:
+        """
+        Stream query results through a server-side cursor.
+        
+        Unlike execute_query, rows are fetched in batches of ``prefetch``
+        so large result sets aren't buffered in memory all at once.
+        
+        Args:
+            query: SQL query
+            *args: Query parameters
+            prefetch: Rows per round-trip (defaults to db_cursor_prefetch)
+            
+        Yields:
+            Result rows
+        """
+        from app.core.config import settings
+        
+        if prefetch is None:
+            prefetch = settings.db_cursor_prefetch
+        
         async with self.get_connection() as conn:
-            return await conn.fetch(query, *args)
+            # Cursors require an open transaction
+            async with conn.transaction():
+                async for row in conn.cursor(query, *args, prefetch=prefetch):
+                    yield row
     
     async def execute_command(self, command: str, *args):
         """Execute a command (INSERT, UPDATE, DELETE)."""
-        async with self.get_connection() as conn:
-            return await conn.execute(command, *args)
+        pool = await self.get_pool()
+        return await pool.execute(command, *args)
     
     async def health_check(self) -> bool:
-        """Check database connection health."""
+        """
+        Check database connection health.
+        
+        The result is cached for db_health_check_ttl_seconds so frequent
+        liveness/readiness probes don't each cost a database round-trip.
+        """
+        from app.core.config import settings
+        
+        now = time.monotonic()
+        if (
+            self._last_health_ts is not None
+            and now - self._last_health_ts < settings.db_health_check_ttl_seconds
+        ):
+            return self._last_health_ok
+        
+        self._last_health_ok = await self._probe_health(settings.db_health_check_timeout)
+        self._last_health_ts = now
+        return self._last_health_ok
+    
+    async def _probe_health(self, timeout: float) -> bool:
+        """Run an actual health probe against the database."""
         try:
-            # Simple query to test connection
-            result = await self.execute_query("SELECT 1 as health_check LIMIT 1")
+            # Acquire with a timeout and ping via the simple query protocol
+            pool = await self.get_pool()
+            async with pool.acquire(timeout=timeout) as conn:
+                await conn.execute("SELECT 1")
             self._is_connected = True
             logger.debug("Database health check passed")
             return True
         except Exception as e:
             self._is_connected = False
-            logger.error(f"Database health check failed: {e}")
+            logger.error("Database health check failed: %s", e)
             return False
     
     @property
@@ -104,6 +227,7 @@ class DatabaseClient:
             await self._pool.close()
             self._pool = None
             self._is_connected = False
+            self._last_health_ts = None
             logger.info("Database connection pool closed")
 
 
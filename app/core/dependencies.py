@@ -4,19 +4,25 @@ Enhanced dependency injection for FastAPI application.
 This module provides comprehensive dependency injection with proper service
 lifecycle management, caching, and error handling.
 """
-from functools import lru_cache
-from typing import Generator, Optional
+from typing import TYPE_CHECKING, AsyncGenerator, Optional
 from fastapi import Depends, Request
 from app.core.database import get_database_client, DatabaseClient
 from app.services.session_service import SessionService
 from app.services.health_service import HealthService
-from app.services.audio_service import AudioService
-from app.services.embedding_service import EmbeddingService
-from app.services.similarity_service import SimilarityService
 from app.core.logging_config import get_logger
 
+if TYPE_CHECKING:
+    # Imported lazily in the factories below to keep worker start-up light
+    from app.services.audio_service import AudioService
+    from app.services.embedding_service import EmbeddingService
+    from app.services.similarity_service import SimilarityService
+
 logger = get_logger(__name__)
 
+# Process-wide service singletons, created on first use
+_session_service: Optional[SessionService] = None
+_health_service: Optional[HealthService] = None
+
 
 # Database Dependencies
 def get_database_client_dependency() -> DatabaseClient:
@@ -30,7 +36,6 @@ def get_database_client_dependency() -> DatabaseClient:
 
 
 # Service Dependencies with proper lifecycle management
-@lru_cache()
 def get_session_service() -> SessionService:
     """
     Get session service instance with dependency injection.
@@ -38,17 +43,17 @@ def get_session_service() -> SessionService:
     Returns:
         SessionService instance with database client
     """
-    try:
-        db_client = get_database_client()
-        service = SessionService(db_client)
-        logger.debug("Session service created successfully")
-        return service
-    except Exception as e:
-        logger.error(f"Failed to create session service: {e}")
-        raise
+    global _session_service
+    if _session_service is None:
+        try:
+            _session_service = SessionService(get_database_client())
+            logger.debug("Session service created successfully")
+        except Exception as e:
+            logger.error("Failed to create session service: %s", e)
+            raise
+    return _session_service
 
 
-@lru_cache()
 def get_health_service() -> HealthService:
     """
     Get health service instance with dependency injection.
@@ -56,79 +61,110 @@ def get_health_service() -> HealthService:
     Returns:
         HealthService instance with database client
     """
-    try:
-        db_client = get_database_client()
-        service = HealthService(db_client)
-        logger.debug("Health service created successfully")
-        return service
-    except Exception as e:
-        logger.error(f"Failed to create health service: {e}")
-        raise
+    global _health_service
+    if _health_service is None:
+        try:
+            _health_service = HealthService(get_database_client())
+            logger.debug("Health service created successfully")
+        except Exception as e:
+            logger.error("Failed to create health service: %s", e)
+            raise
+    return _health_service
 
 
-def get_audio_service() -> AudioService:
+def get_audio_service(request: Request) -> "AudioService":
     """
-    Get audio service instance.
+    Get the application-wide audio service instance.
+    
+    The instance is created on first use and stored on ``app.state``, so
+    openai/pydub are only imported once a request actually needs them.
     
+    Args:
+        request: FastAPI request object
+        
     Returns:
         AudioService instance
     """
-    try:
-        service = AudioService()
-        logger.debug("Audio service created successfully")
-        return service
-    except Exception as e:
-        logger.error(f"Failed to create audio service: {e}")
-        raise
+    service = getattr(request.app.state, 'audio_service', None)
+    if service is None:
+        from app.services.audio_service import AudioService
+        try:
+            service = AudioService()
+            request.app.state.audio_service = service
+            logger.debug("Audio service created successfully")
+        except Exception as e:
+            logger.error("Failed to create audio service: %s", e)
+            raise
+    return service
 
 
-def get_embedding_service() -> Generator[EmbeddingService, None, None]:
+def _get_shared_embedding_service(request: Request) -> "EmbeddingService":
+    """
+    Get the application-wide embedding service instance.
+    
+    Reusing one instance keeps the OpenAI client's connection pool warm
+    instead of paying client setup (and DNS/TLS) on every request.
+    
+    Args:
+        request: FastAPI request object
+        
+    Returns:
+        EmbeddingService instance
+    """
+    service = getattr(request.app.state, 'embedding_service', None)
+    if service is None:
+        from app.services.embedding_service import EmbeddingService
+        try:
+            service = EmbeddingService()
+            request.app.state.embedding_service = service
+            logger.debug("Embedding service created successfully")
+        except Exception as e:
+            logger.error("Failed to create embedding service: %s", e)
+            raise
+    return service
+
+
+async def get_embedding_service(request: Request) -> AsyncGenerator["EmbeddingService", None]:
     """
     Get embedding service instance with proper lifecycle management.
     
-    This dependency ensures the embedding service is properly closed
-    after the request is completed.
+    Yields the application-wide instance; it is closed once at shutdown
+    rather than per request, so its HTTP connections are reused.
     
+    Args:
+        request: FastAPI request object
+        
     Yields:
         EmbeddingService instance
     """
-    service = None
-    try:
-        service = EmbeddingService()
-        logger.debug("Embedding service created successfully")
-        yield service
-    except Exception as e:
-        logger.error(f"Failed to create embedding service: {e}")
-        raise
-    finally:
-        if service:
-            try:
-                # Note: EmbeddingService.close() is async, but we can't await in finally
-                # The service should handle cleanup in its destructor or context manager
-                logger.debug("Embedding service cleanup completed")
-            except Exception as e:
-                logger.warning(f"Error during embedding service cleanup: {e}")
-
-
-@lru_cache()
-def get_similarity_service() -> SimilarityService:
-    """
-    Get similarity service instance.
+    yield _get_shared_embedding_service(request)
+
+
+def get_similarity_service(request: Request) -> "SimilarityService":
+    """
+    Get the application-wide similarity service instance.
     
+    Args:
+        request: FastAPI request object
+        
     Returns:
         SimilarityService instance
     """
-    try:
-        service = SimilarityService()
-        logger.debug("Similarity service created successfully")
-        return service
-    except Exception as e:
-        logger.error(f"Failed to create similarity service: {e}")
-        raise
+    service = getattr(request.app.state, 'similarity_service', None)
+    if service is None:
+        from app.services.similarity_service import SimilarityService
+        try:
+            service = SimilarityService()
+            request.app.state.similarity_service = service
+            logger.debug("Similarity service created successfully")
+        except Exception as e:
+            logger.error("Failed to create similarity service: %s", e)
+            raise
+    return service
 
 
 # Request Context Dependencies
-def get_request_id(request: Request) -> Optional[str]:
+def get_request_id(request: Request) -> str:
     """
     Extract request ID from request state.
     
@@ -136,12 +172,12 @@ def get_request_id(request: Request) -> Optional[str]:
         request: FastAPI request object
         
     Returns:
-        Request ID if available, None otherwise
+        Request ID assigned by RequestIdMiddleware
     """
-    return getattr(request.state, 'request_id', None)
+    return request.state.request_id
 
 
-def get_correlation_id(request: Request) -> Optional[str]:
+def get_correlation_id(request: Request) -> str:
     """
     Extract correlation ID from request state.
     
@@ -149,26 +185,29 @@ def get_correlation_id(request: Request) -> Optional[str]:
         request: FastAPI request object
         
     Returns:
-        Correlation ID if available, None otherwise
+        Correlation ID assigned by RequestIdMiddleware
     """
-    return getattr(request.state, 'correlation_id', None)
+    return request.state.correlation_id
 
 
 # Combined Service Dependencies for common use cases
-def get_similarity_pipeline_services() -> tuple[AudioService, EmbeddingService, SimilarityService]:
+def get_similarity_pipeline_services(request: Request) -> "tuple[AudioService, EmbeddingService, SimilarityService]":
     """
     Get all services needed for similarity calculation pipeline.
     
+    Args:
+        request: FastAPI request object
+        
     Returns:
         Tuple of (AudioService, EmbeddingService, SimilarityService)
     """
     try:
-        audio_service = get_audio_service()
-        embedding_service = EmbeddingService()  # Create fresh instance for pipeline
-        similarity_service = get_similarity_service()
+        audio_service = get_audio_service(request)
+        embedding_service = _get_shared_embedding_service(request)
+        similarity_service = get_similarity_service(request)
         
         logger.debug("Similarity pipeline services created successfully")
         return audio_service, embedding_service, similarity_service
     except Exception as e:
-        logger.error(f"Failed to create similarity pipeline services: {e}")
+        logger.error("Failed to create similarity pipeline services: %s", e)
         raise
\ No newline at end of file
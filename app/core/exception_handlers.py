@@ -6,12 +6,14 @@ error responses across all endpoints.
 """
 
 from app.core.logging_config import get_logger
+import logging
 import uuid
-from datetime import datetime
-from typing import Union
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Union
 
-from fastapi import Request, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import Request, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import ValidationError
@@ -38,6 +40,112 @@ from app.core.exceptions import (
 
 logger = get_logger(__name__)
 
+# Map exception types to HTTP status codes (built once at import)
+_STATUS_BY_EXC = {
+    # Database errors -> 503 Service Unavailable
+    DatabaseError: status.HTTP_503_SERVICE_UNAVAILABLE,
+    DatabaseConnectionError: status.HTTP_503_SERVICE_UNAVAILABLE,
+    DatabaseTimeoutError: status.HTTP_503_SERVICE_UNAVAILABLE,
+    
+    # Session errors
+    SessionNotFoundError: status.HTTP_404_NOT_FOUND,
+    SessionValidationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    
+    # Audio errors
+    AudioValidationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    AudioProcessingError: status.HTTP_502_BAD_GATEWAY,
+    TranscriptionError: status.HTTP_502_BAD_GATEWAY,
+    
+    # External service errors -> 502 Bad Gateway
+    ExternalServiceError: status.HTTP_502_BAD_GATEWAY,
+    OpenAIServiceError: status.HTTP_502_BAD_GATEWAY,
+    EmbeddingError: status.HTTP_502_BAD_GATEWAY,
+    WhisperError: status.HTTP_502_BAD_GATEWAY,
+    
+    # Rate limiting -> 429 Too Many Requests
+    RateLimitError: status.HTTP_429_TOO_MANY_REQUESTS,
+    
+    # Processing errors -> 500 Internal Server Error
+    SimilarityError: status.HTTP_500_INTERNAL_SERVER_ERROR,
+    
+    # Validation errors -> 422 Unprocessable Entity
+    CustomValidationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
+    
+    # Configuration errors -> 500 Internal Server Error
+    ConfigurationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
+}
+
+# Map common HTTP status codes to error codes
+_HTTP_ERROR_CODES = {
+    400: "BAD_REQUEST",
+    401: "UNAUTHORIZED",
+    403: "FORBIDDEN",
+    404: "NOT_FOUND",
+    405: "METHOD_NOT_ALLOWED",
+    422: "UNPROCESSABLE_ENTITY",
+    429: "TOO_MANY_REQUESTS",
+    500: "INTERNAL_SERVER_ERROR",
+    502: "BAD_GATEWAY",
+    503: "SERVICE_UNAVAILABLE",
+    504: "GATEWAY_TIMEOUT"
+}
+_DEFAULT_HTTP_ERROR_CODE = "HTTP_ERROR"
+
+# Pre-serialized body for unhandled exceptions. Every placeholder is filled
+# with JSON-safe text (a class name, an ISO timestamp and a UUID).
+_GENERIC_500_TEMPLATE = (
+    b'{"error_code":"INTERNAL_SERVER_ERROR",'
+    b'"message":"An unexpected error occurred",'
+    b'"details":{"exception_type":"%s"},'
+    b'"timestamp":"%s","request_id":"%s"}'
+)
+
+
+@lru_cache(maxsize=256)
+def _status_for(exc_type: type) -> int:
+    """
+    Resolve the HTTP status for an exception type, honouring subclasses.
+    
+    Walks the MRO so subclasses of mapped exceptions inherit their status;
+    results are cached per concrete type.
+    """
+    for base in exc_type.__mro__:
+        status_code = _STATUS_BY_EXC.get(base)
+        if status_code is not None:
+            return status_code
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+def _format_validation_errors(errors: List[Dict[str, Any]], include_input: bool = False) -> List[Dict[str, Any]]:
+    """
+    Convert Pydantic error dicts into the API's validation error format.
+    
+    Args:
+        errors: Errors as returned by ``exc.errors()``
+        include_input: Whether to echo the offending input value
+        
+    Returns:
+        List of validation error dicts
+    """
+    if include_input:
+        return [
+            {
+                "field": ".".join(map(str, error["loc"])),
+                "message": error["msg"],
+                "type": error["type"],
+                "input": error.get("input")
+            }
+            for error in errors
+        ]
+    return [
+        {
+            "field": ".".join(map(str, error["loc"])),
+            "message": error["msg"],
+            "type": error["type"]
+        }
+        for error in errors
+    ]
+
 
 def create_error_response(
     error_code: str,
@@ -45,7 +153,7 @@ def create_error_response(
     status_code: int,
     details: dict = None,
     request_id: str = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Create a standardized error response.
     
@@ -57,85 +165,48 @@ def create_error_response(
         request_id: Unique request identifier
         
     Returns:
-        JSONResponse with standardized error format
+        ORJSONResponse with standardized error format
     """
     if request_id is None:
         request_id = str(uuid.uuid4())
         
-    error_response = {
-        "error_code": error_code,
-        "message": message,
-        "details": details or {},
-        "timestamp": datetime.utcnow().isoformat(),
-        "request_id": request_id
-    }
-    
-    return JSONResponse(
-        status_code=status_code,
-        content=error_response
+    return ORJSONResponse(
+        {
+            "error_code": error_code,
+            "message": message,
+            "details": details or {},
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "request_id": request_id
+        },
+        status_code=status_code
     )
 
 
 async def speech_similarity_api_exception_handler(
     request: Request, 
     exc: SpeechSimilarityAPIError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle custom SpeechSimilarityAPIError exceptions.
     
     This handler processes all custom exceptions that inherit from
     SpeechSimilarityAPIError and maps them to appropriate HTTP status codes.
     """
-    request_id = getattr(request.state, 'request_id', str(uuid.uuid4()))
-    
-    # Map exception types to HTTP status codes
-    status_code_mapping = {
-        # Database errors -> 503 Service Unavailable
-        DatabaseError: status.HTTP_503_SERVICE_UNAVAILABLE,
-        DatabaseConnectionError: status.HTTP_503_SERVICE_UNAVAILABLE,
-        DatabaseTimeoutError: status.HTTP_503_SERVICE_UNAVAILABLE,
-        
-        # Session errors
-        SessionNotFoundError: status.HTTP_404_NOT_FOUND,
-        SessionValidationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
-        
-        # Audio errors
-        AudioValidationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
-        AudioProcessingError: status.HTTP_502_BAD_GATEWAY,
-        TranscriptionError: status.HTTP_502_BAD_GATEWAY,
-        
-        # External service errors -> 502 Bad Gateway
-        ExternalServiceError: status.HTTP_502_BAD_GATEWAY,
-        OpenAIServiceError: status.HTTP_502_BAD_GATEWAY,
-        EmbeddingError: status.HTTP_502_BAD_GATEWAY,
-        WhisperError: status.HTTP_502_BAD_GATEWAY,
-        
-        # Rate limiting -> 429 Too Many Requests
-        RateLimitError: status.HTTP_429_TOO_MANY_REQUESTS,
-        
-        # Processing errors -> 500 Internal Server Error
-        SimilarityError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-        
-        # Validation errors -> 422 Unprocessable Entity
-        CustomValidationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
-        
-        # Configuration errors -> 500 Internal Server Error
-        ConfigurationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-    }
+    request_id = request.state.request_id
     
     # Get status code for this exception type
-    status_code = status_code_mapping.get(type(exc), status.HTTP_500_INTERNAL_SERVER_ERROR)
+    status_code = _status_for(type(exc))
     
     # Log the error with appropriate level
     if status_code >= 500:
-        logger.error(f"Server error ({exc.error_code}): {exc.message}", extra={
+        logger.error("Server error (%s): %s", exc.error_code, exc.message, extra={
             "error_code": exc.error_code,
             "details": exc.details,
             "request_id": request_id,
             "exception_type": type(exc).__name__
         })
     elif status_code >= 400:
-        logger.warning(f"Client error ({exc.error_code}): {exc.message}", extra={
+        logger.warning("Client error (%s): %s", exc.error_code, exc.message, extra={
             "error_code": exc.error_code,
             "details": exc.details,
             "request_id": request_id,
@@ -154,56 +225,41 @@ async def speech_similarity_api_exception_handler(
 async def http_exception_handler(
     request: Request, 
     exc: Union[HTTPException, StarletteHTTPException]
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle FastAPI HTTPException and Starlette HTTPException.
     
     This handler ensures that HTTP exceptions follow the same
     error response format as custom exceptions.
     """
-    request_id = getattr(request.state, 'request_id', str(uuid.uuid4()))
+    detail = getattr(exc, 'detail', None)
+    
+    # Already-formatted error bodies (from our custom error responses) are
+    # returned as-is, before any request ID, mapping or logging work
+    if isinstance(detail, dict) and 'error_code' in detail:
+        return ORJSONResponse(detail, status_code=exc.status_code)
+    
+    request_id = request.state.request_id
     
     # Extract error details if they exist
     details = {}
-    if hasattr(exc, 'detail') and isinstance(exc.detail, dict):
-        # If detail is already a dict (from our custom error responses), use it
-        if 'error_code' in exc.detail:
-            return JSONResponse(
-                status_code=exc.status_code,
-                content=exc.detail
-            )
-        else:
-            details = exc.detail
+    if isinstance(detail, dict):
+        details = detail
     elif hasattr(exc, 'detail'):
-        details = {"detail": exc.detail}
-    
-    # Map common HTTP status codes to error codes
-    error_code_mapping = {
-        400: "BAD_REQUEST",
-        401: "UNAUTHORIZED",
-        403: "FORBIDDEN", 
-        404: "NOT_FOUND",
-        405: "METHOD_NOT_ALLOWED",
-        422: "UNPROCESSABLE_ENTITY",
-        429: "TOO_MANY_REQUESTS",
-        500: "INTERNAL_SERVER_ERROR",
-        502: "BAD_GATEWAY",
-        503: "SERVICE_UNAVAILABLE",
-        504: "GATEWAY_TIMEOUT"
-    }
+        details = {"detail": detail}
     
-    error_code = error_code_mapping.get(exc.status_code, "HTTP_ERROR")
+    error_code = _HTTP_ERROR_CODES.get(exc.status_code, _DEFAULT_HTTP_ERROR_CODE)
     message = str(exc.detail) if hasattr(exc, 'detail') else f"HTTP {exc.status_code} error"
     
     # Log the error
     if exc.status_code >= 500:
-        logger.error(f"HTTP error {exc.status_code}: {message}", extra={
+        logger.error("HTTP error %s: %s", exc.status_code, message, extra={
             "status_code": exc.status_code,
             "details": details,
             "request_id": request_id
         })
     elif exc.status_code >= 400:
-        logger.warning(f"HTTP error {exc.status_code}: {message}", extra={
+        logger.warning("HTTP error %s: %s", exc.status_code, message, extra={
             "status_code": exc.status_code,
             "details": details,
             "request_id": request_id
@@ -221,31 +277,24 @@ async def http_exception_handler(
 async def validation_exception_handler(
     request: Request, 
     exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle Pydantic validation errors from request parsing.
     
     This handler processes validation errors that occur when
     request data doesn't match the expected Pydantic models.
     """
-    request_id = getattr(request.state, 'request_id', str(uuid.uuid4()))
+    request_id = request.state.request_id
     
     # Extract validation error details
-    validation_errors = []
-    for error in exc.errors():
-        validation_errors.append({
-            "field": ".".join(str(loc) for loc in error["loc"]),
-            "message": error["msg"],
-            "type": error["type"],
-            "input": error.get("input")
-        })
+    validation_errors = _format_validation_errors(exc.errors(), include_input=True)
     
     details = {
         "validation_errors": validation_errors,
         "error_count": len(validation_errors)
     }
     
-    logger.warning(f"Request validation failed: {len(validation_errors)} errors", extra={
+    logger.warning("Request validation failed: %s errors", len(validation_errors), extra={
         "validation_errors": validation_errors,
         "request_id": request_id
     })
@@ -262,30 +311,24 @@ async def validation_exception_handler(
 async def pydantic_validation_exception_handler(
     request: Request, 
     exc: ValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle Pydantic ValidationError exceptions.
     
     This handler processes validation errors that occur during
     data model validation outside of request parsing.
     """
-    request_id = getattr(request.state, 'request_id', str(uuid.uuid4()))
+    request_id = request.state.request_id
     
     # Extract validation error details
-    validation_errors = []
-    for error in exc.errors():
-        validation_errors.append({
-            "field": ".".join(str(loc) for loc in error["loc"]),
-            "message": error["msg"],
-            "type": error["type"]
-        })
+    validation_errors = _format_validation_errors(exc.errors())
     
     details = {
         "validation_errors": validation_errors,
         "error_count": len(validation_errors)
     }
     
-    logger.warning(f"Data validation failed: {len(validation_errors)} errors", extra={
+    logger.warning("Data validation failed: %s errors", len(validation_errors), extra={
         "validation_errors": validation_errors,
         "request_id": request_id
     })
@@ -302,31 +345,34 @@ async def pydantic_validation_exception_handler(
 async def generic_exception_handler(
     request: Request, 
     exc: Exception
-) -> JSONResponse:
+) -> Response:
     """
     Handle any unhandled exceptions.
     
     This is the fallback handler for any exceptions that aren't
     caught by more specific handlers.
     """
-    request_id = getattr(request.state, 'request_id', str(uuid.uuid4()))
+    request_id = request.state.request_id
     
-    # Log the unexpected error with full traceback
-    logger.error(f"Unhandled exception: {type(exc).__name__}: {str(exc)}", extra={
-        "exception_type": type(exc).__name__,
-        "exception_message": str(exc),
-        "request_id": request_id
-    }, exc_info=True)
+    exc_type_name = type(exc).__name__
     
-    # Don't expose internal error details in production
-    details = {
-        "exception_type": type(exc).__name__
-    }
+    # Log the unexpected error with full traceback (only formatted if emitted)
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error("Unhandled exception: %s: %s", exc_type_name, exc, extra={
+            "exception_type": exc_type_name,
+            "exception_message": str(exc),
+            "request_id": request_id
+        }, exc_info=True)
     
-    return create_error_response(
-        error_code="INTERNAL_SERVER_ERROR",
-        message="An unexpected error occurred",
+    # Don't expose internal error details in production. The body is
+    # constant apart from three fields, so fill the template directly
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+    return Response(
+        content=_GENERIC_500_TEMPLATE % (
+            exc_type_name.encode(),
+            timestamp.encode(),
+            request_id.encode()
+        ),
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        details=details,
-        request_id=request_id
+        media_type="application/json"
     )
\ No newline at end of file
@@ -16,26 +16,39 @@ class SpeechSimilarityAPIError(Exception):
     consistent error handling and response formatting.
     """
     
+    # Subclasses override this class attribute; an instance only stores its
+    # own code when one is passed explicitly
+    error_code = "UNKNOWN_ERROR"
+    
     def __init__(
         self, 
         message: str, 
-        error_code: str = "UNKNOWN_ERROR",
+        error_code: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
         super().__init__(message)
         self.message = message
-        self.error_code = error_code
-        self.details = details or {}
+        if error_code is not None:
+            self.error_code = error_code
+        self.details = details if details is not None else {}
 
 
 # Database-related exceptions
 class DatabaseError(SpeechSimilarityAPIError):
     """Base exception for database-related errors."""
     
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+    error_code = "DATABASE_ERROR"
+    
+    def __init__(
+        self,
+        message: str,
+        details: Optional[Dict[str, Any]] = None,
+        *,
+        error_code: Optional[str] = None
+    ):
         super().__init__(
             message=message,
-            error_code="DATABASE_ERROR",
+            error_code=error_code,
             details=details
         )
 
@@ -43,30 +56,28 @@ class DatabaseError(SpeechSimilarityAPIError):
 class DatabaseConnectionError(DatabaseError):
     """Raised when database connection fails."""
     
+    error_code = "DATABASE_CONNECTION_ERROR"
+    
     def __init__(self, message: str = "Database connection failed", details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            message=message,
-            details=details
-        )
-        self.error_code = "DATABASE_CONNECTION_ERROR"
+        SpeechSimilarityAPIError.__init__(self, message, details=details)
 
 
 class DatabaseTimeoutError(DatabaseError):
     """Raised when database operation times out."""
     
+    error_code = "DATABASE_TIMEOUT_ERROR"
+    
     def __init__(self, message: str = "Database operation timed out", details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            message=message,
-            details=details
-        )
-        self.error_code = "DATABASE_TIMEOUT_ERROR"
+        SpeechSimilarityAPIError.__init__(self, message, details=details)
 
 
 # Session-related exceptions
 class SessionError(SpeechSimilarityAPIError):
     """Base exception for session-related errors."""
     
-    def __init__(self, message: str, error_code: str = "SESSION_ERROR", details: Optional[Dict[str, Any]] = None):
+    error_code = "SESSION_ERROR"
+    
+    def __init__(self, message: str, error_code: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
             error_code=error_code,
@@ -77,35 +88,33 @@ class SessionError(SpeechSimilarityAPIError):
 class SessionNotFoundError(SessionError):
     """Raised when a session is not found."""
     
+    error_code = "SESSION_NOT_FOUND"
+    
     def __init__(self, session_id: int, details: Optional[Dict[str, Any]] = None):
         message = f"Session with ID {session_id} was not found"
         session_details = {"session_id": session_id}
         if details:
             session_details.update(details)
         
-        super().__init__(
-            message=message,
-            error_code="SESSION_NOT_FOUND",
-            details=session_details
-        )
+        SpeechSimilarityAPIError.__init__(self, message, details=session_details)
 
 
 class SessionValidationError(SessionError):
     """Raised when session data validation fails."""
     
+    error_code = "SESSION_VALIDATION_ERROR"
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            message=message,
-            error_code="SESSION_VALIDATION_ERROR",
-            details=details
-        )
+        SpeechSimilarityAPIError.__init__(self, message, details=details)
 
 
 # Audio processing exceptions
 class AudioError(SpeechSimilarityAPIError):
     """Base exception for audio-related errors."""
     
-    def __init__(self, message: str, error_code: str = "AUDIO_ERROR", details: Optional[Dict[str, Any]] = None):
+    error_code = "AUDIO_ERROR"
+    
+    def __init__(self, message: str, error_code: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
             error_code=error_code,
@@ -116,41 +125,37 @@ class AudioError(SpeechSimilarityAPIError):
 class AudioValidationError(AudioError):
     """Raised when audio validation fails."""
     
+    error_code = "INVALID_AUDIO_DATA"
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            message=message,
-            error_code="INVALID_AUDIO_DATA",
-            details=details
-        )
+        SpeechSimilarityAPIError.__init__(self, message, details=details)
 
 
 class AudioProcessingError(AudioError):
     """Raised when audio processing fails."""
     
+    error_code = "AUDIO_PROCESSING_ERROR"
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            message=message,
-            error_code="AUDIO_PROCESSING_ERROR",
-            details=details
-        )
+        SpeechSimilarityAPIError.__init__(self, message, details=details)
 
 
 class TranscriptionError(AudioError):
     """Raised when transcription fails."""
     
+    error_code = "TRANSCRIPTION_SERVICE_ERROR"
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            message=message,
-            error_code="TRANSCRIPTION_SERVICE_ERROR",
-            details=details
-        )
+        SpeechSimilarityAPIError.__init__(self, message, details=details)
 
 
 # External service exceptions
 class ExternalServiceError(SpeechSimilarityAPIError):
     """Base exception for external service errors."""
     
-    def __init__(self, message: str, service_name: str, error_code: str = "EXTERNAL_SERVICE_ERROR", details: Optional[Dict[str, Any]] = None):
+    error_code = "EXTERNAL_SERVICE_ERROR"
+    
+    def __init__(self, message: str, service_name: str, error_code: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
         service_details = {"service": service_name}
         if details:
             service_details.update(details)
@@ -162,72 +167,72 @@ class ExternalServiceError(SpeechSimilarityAPIError):
         )
 
 
+def _openai_details(operation: str, details: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the details dict shared by the OpenAI service errors."""
+    openai_details = {"service": "openai", "operation": operation}
+    if details:
+        openai_details.update(details)
+    return openai_details
+
+
 class OpenAIServiceError(ExternalServiceError):
     """Raised when OpenAI service calls fail."""
     
+    error_code = "OPENAI_SERVICE_ERROR"
+    
     def __init__(self, message: str, operation: str, details: Optional[Dict[str, Any]] = None):
-        operation_details = {"operation": operation}
-        if details:
-            operation_details.update(details)
-            
-        super().__init__(
-            message=message,
-            service_name="openai",
-            error_code="OPENAI_SERVICE_ERROR",
-            details=operation_details
+        SpeechSimilarityAPIError.__init__(
+            self, message, details=_openai_details(operation, details)
         )
 
 
 class EmbeddingError(OpenAIServiceError):
     """Raised when embedding generation fails."""
     
+    error_code = "EMBEDDING_SERVICE_ERROR"
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            message=message,
-            operation="embedding_generation",
-            details=details
+        SpeechSimilarityAPIError.__init__(
+            self, message, details=_openai_details("embedding_generation", details)
         )
-        self.error_code = "EMBEDDING_SERVICE_ERROR"
 
 
 class WhisperError(OpenAIServiceError):
     """Raised when Whisper transcription fails."""
     
+    error_code = "WHISPER_SERVICE_ERROR"
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            message=message,
-            operation="speech_transcription",
-            details=details
+        SpeechSimilarityAPIError.__init__(
+            self, message, details=_openai_details("speech_transcription", details)
         )
-        self.error_code = "WHISPER_SERVICE_ERROR"
 
 
 # Rate limiting exceptions
 class RateLimitError(ExternalServiceError):
     """Raised when API rate limits are exceeded."""
     
+    error_code = "RATE_LIMIT_EXCEEDED"
+    
     def __init__(self, service_name: str, retry_after: Optional[int] = None, details: Optional[Dict[str, Any]] = None):
-        message = f"Rate limit exceeded for {service_name}"
+        message = "Rate limit exceeded for " + service_name
         if retry_after:
             message += f". Retry after {retry_after} seconds"
             
-        rate_limit_details = {"retry_after": retry_after}
+        rate_limit_details = {"service": service_name, "retry_after": retry_after}
         if details:
             rate_limit_details.update(details)
             
-        super().__init__(
-            message=message,
-            service_name=service_name,
-            error_code="RATE_LIMIT_EXCEEDED",
-            details=rate_limit_details
-        )
+        SpeechSimilarityAPIError.__init__(self, message, details=rate_limit_details)
 
 
 # Processing exceptions
 class ProcessingError(SpeechSimilarityAPIError):
     """Base exception for processing-related errors."""
     
-    def __init__(self, message: str, error_code: str = "PROCESSING_ERROR", details: Optional[Dict[str, Any]] = None):
+    error_code = "PROCESSING_ERROR"
+    
+    def __init__(self, message: str, error_code: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
             error_code=error_code,
@@ -238,19 +243,26 @@ class ProcessingError(SpeechSimilarityAPIError):
 class SimilarityError(ProcessingError):
     """Raised when similarity calculation fails."""
     
+    error_code = "SIMILARITY_CALCULATION_ERROR"
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            message=message,
-            error_code="SIMILARITY_CALCULATION_ERROR",
-            details=details
-        )
+        SpeechSimilarityAPIError.__init__(self, message, details=details)
 
 
 # Validation exceptions
 class ValidationError(SpeechSimilarityAPIError):
     """Raised when request validation fails."""
     
-    def __init__(self, message: str, field: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
+    error_code = "VALIDATION_ERROR"
+    
+    def __init__(
+        self,
+        message: str,
+        field: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+        *,
+        error_code: Optional[str] = None
+    ):
         validation_details = {}
         if field:
             validation_details["field"] = field
@@ -259,7 +271,7 @@ class ValidationError(SpeechSimilarityAPIError):
             
         super().__init__(
             message=message,
-            error_code="VALIDATION_ERROR",
+            error_code=error_code,
             details=validation_details
         )
 
@@ -268,6 +280,8 @@ class ValidationError(SpeechSimilarityAPIError):
 class ConfigurationError(SpeechSimilarityAPIError):
     """Raised when configuration is invalid or missing."""
     
+    error_code = "CONFIGURATION_ERROR"
+    
     def __init__(self, message: str, config_key: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
         config_details = {}
         if config_key:
@@ -277,6 +291,5 @@ class ConfigurationError(SpeechSimilarityAPIError):
             
         super().__init__(
             message=message,
-            error_code="CONFIGURATION_ERROR",
             details=config_details
         )
\ No newline at end of file
@@ -12,27 +12,51 @@ This module provides comprehensive logging setup with:
 import logging
 import logging.config
 import sys
+from array import array
+from collections import Counter
 from typing import Dict, Any, Optional
-from datetime import datetime
-import json
+from datetime import datetime, timezone
 import uuid
 from contextvars import ContextVar
 
+import orjson
+
 from app.core.config import settings
 
 # Context variable for correlation ID
 correlation_id: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
 
 
-class CorrelationIdFilter(logging.Filter):
-    """
-    Logging filter to add correlation ID to log records.
+_base_record_factory = logging.getLogRecordFactory()
+
+
+def _correlation_record_factory(*args, **kwargs) -> logging.LogRecord:
     """
+    Create log records with the current correlation ID attached.
     
-    def filter(self, record: logging.LogRecord) -> bool:
-        """Add correlation ID to the log record."""
-        record.correlation_id = correlation_id.get() or "unknown"
-        return True
+    Installed as the LogRecord factory so the ID is set at construction,
+    rather than by a filter run on every handler.
+    """
+    record = _base_record_factory(*args, **kwargs)
+    record.correlation_id = current_correlation_id()
+    return record
+
+
+# Attributes every LogRecord carries; anything else was passed via ``extra``
+_STD_LOGRECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
+    'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+    'thread', 'threadName', 'processName', 'process', 'taskName',
+    'getMessage', 'message', 'asctime', 'correlation_id'
+})
+
+# Extra fields emitted right after the base fields, in this order
+_KNOWN_EXTRA_FIELDS = (
+    'request_id', 'method', 'path', 'status_code', 'processing_time',
+    'client_ip', 'user_agent', 'query_params', 'exception_type',
+    'exception_message'
+)
 
 
 class StructuredFormatter(logging.Formatter):
@@ -44,7 +68,7 @@ class StructuredFormatter(logging.Formatter):
         """Format log record as structured JSON."""
         # Base log data
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -54,43 +78,23 @@ class StructuredFormatter(logging.Formatter):
             "line": record.lineno,
         }
         
-        # Add extra fields if present
-        if hasattr(record, 'request_id'):
-            log_data['request_id'] = record.request_id
-        if hasattr(record, 'method'):
-            log_data['method'] = record.method
-        if hasattr(record, 'path'):
-            log_data['path'] = record.path
-        if hasattr(record, 'status_code'):
-            log_data['status_code'] = record.status_code
-        if hasattr(record, 'processing_time'):
-            log_data['processing_time'] = record.processing_time
-        if hasattr(record, 'client_ip'):
-            log_data['client_ip'] = record.client_ip
-        if hasattr(record, 'user_agent'):
-            log_data['user_agent'] = record.user_agent
-        if hasattr(record, 'query_params'):
-            log_data['query_params'] = record.query_params
-        if hasattr(record, 'exception_type'):
-            log_data['exception_type'] = record.exception_type
-        if hasattr(record, 'exception_message'):
-            log_data['exception_message'] = record.exception_message
+        # Add well-known extra fields first so they keep a stable order
+        record_dict = record.__dict__
+        for key in _KNOWN_EXTRA_FIELDS:
+            if key in record_dict:
+                log_data[key] = record_dict[key]
         
         # Add exception info if present
         if record.exc_info:
             log_data['exception'] = self.formatException(record.exc_info)
         
         # Add any additional custom fields
-        for key, value in record.__dict__.items():
-            if key not in log_data and not key.startswith('_') and key not in [
-                'name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 
-                'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
-                'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
-                'thread', 'threadName', 'processName', 'process', 'getMessage'
-            ]:
+        for key, value in record_dict.items():
+            if key not in _STD_LOGRECORD_ATTRS and key not in log_data and not key.startswith('_'):
                 log_data[key] = value
         
-        return json.dumps(log_data, default=str)
+        # orjson serializes the datetime itself and renders UTC as "Z"
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS).decode()
 
 
 def setup_logging() -> None:
@@ -115,17 +119,11 @@ def setup_logging() -> None:
                 "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
             }
         },
-        "filters": {
-            "correlation_id": {
-                "()": CorrelationIdFilter,
-            }
-        },
         "handlers": {
             "console": {
                 "class": "logging.StreamHandler",
                 "stream": sys.stdout,
                 "formatter": "structured" if (hasattr(settings, 'structured_logging') and settings.structured_logging) else "simple",
-                "filters": ["correlation_id"],
                 "level": log_level,
             }
         },
@@ -152,10 +150,26 @@ def setup_logging() -> None:
         }
     }
     
+    # Attach correlation IDs to every record as it is created
+    logging.setLogRecordFactory(_correlation_record_factory)
+    
     # Apply logging configuration
     logging.config.dictConfig(config)
 
 
+def current_correlation_id() -> str:
+    """
+    Get the current correlation ID without generating one.
+    
+    RequestTrackingMiddleware sets it for every request, so callers on the
+    request path never need to allocate a new UUID.
+    
+    Returns:
+        Current correlation ID, or "unknown" outside a request
+    """
+    return correlation_id.get() or "unknown"
+
+
 def get_correlation_id() -> str:
     """
     Get the current correlation ID or generate a new one.
@@ -194,62 +208,121 @@ def get_logger(name: str) -> logging.Logger:
 
 
 # Performance metrics tracking
+
+# Response time histogram: bucket i counts latencies below 2**i microseconds,
+# covering 1us up to ~67s; slower requests land in the last bucket.
+RESPONSE_TIME_BUCKETS = 27
+RESPONSE_TIME_QUANTILES = (0.5, 0.95, 0.99)
+
+
 class PerformanceMetrics:
     """
     Simple in-memory performance metrics tracking.
+    
+    Response times are aggregated into a fixed-size log2 histogram so each
+    request costs a single increment and quantiles can be estimated on read.
+    
+    Updates come only from RequestTrackingMiddleware on the event loop, and
+    none of the methods await, so each update runs without interleaving and
+    needs no locking. Each worker process keeps its own counters.
     """
     
     def __init__(self):
-        self.metrics: Dict[str, Any] = {
-            "requests": {
-                "total": 0,
-                "by_method": {},
-                "by_status": {},
-                "by_endpoint": {},
-            },
-            "response_times": {
-                "total_time": 0.0,
-                "count": 0,
-                "average": 0.0,
-                "min": float('inf'),
-                "max": 0.0,
-            },
-            "errors": {
-                "total": 0,
-                "by_type": {},
-            }
-        }
+        self.total_requests = 0
+        self.requests_by_method: Counter = Counter()
+        self.requests_by_status: Counter = Counter()
+        self.requests_by_endpoint: Counter = Counter()
+        self.total_time = 0.0
+        self.min_time = float('inf')
+        self.max_time = 0.0
+        self.total_errors = 0
+        self.errors_by_type: Counter = Counter()
+        self.response_time_histogram = array('Q', [0] * RESPONSE_TIME_BUCKETS)
+        
+        # With metrics disabled, recording becomes a no-op on the instance
+        if not settings.metrics_enabled:
+            self.record_request = self._noop
+            self.record_error = self._noop
+    
+    @staticmethod
+    def _noop(*args, **kwargs) -> None:
+        """Discard a metrics update when metrics are disabled."""
     
     def record_request(self, method: str, endpoint: str, status_code: int, processing_time: float) -> None:
         """Record request metrics."""
         # Update request counts
-        self.metrics["requests"]["total"] += 1
-        self.metrics["requests"]["by_method"][method] = self.metrics["requests"]["by_method"].get(method, 0) + 1
-        self.metrics["requests"]["by_status"][str(status_code)] = self.metrics["requests"]["by_status"].get(str(status_code), 0) + 1
-        self.metrics["requests"]["by_endpoint"][endpoint] = self.metrics["requests"]["by_endpoint"].get(endpoint, 0) + 1
+        self.total_requests += 1
+        self.requests_by_method[method] += 1
+        self.requests_by_status[status_code] += 1
+        self.requests_by_endpoint[endpoint] += 1
         
         # Update response time metrics
-        self.metrics["response_times"]["total_time"] += processing_time
-        self.metrics["response_times"]["count"] += 1
-        self.metrics["response_times"]["average"] = self.metrics["response_times"]["total_time"] / self.metrics["response_times"]["count"]
-        self.metrics["response_times"]["min"] = min(self.metrics["response_times"]["min"], processing_time)
-        self.metrics["response_times"]["max"] = max(self.metrics["response_times"]["max"], processing_time)
+        self.total_time += processing_time
+        if processing_time < self.min_time:
+            self.min_time = processing_time
+        if processing_time > self.max_time:
+            self.max_time = processing_time
+        
+        bucket = int(processing_time * 1_000_000).bit_length()
+        self.response_time_histogram[min(bucket, RESPONSE_TIME_BUCKETS - 1)] += 1
         
         # Record errors
         if status_code >= 400:
-            self.metrics["errors"]["total"] += 1
+            self.total_errors += 1
     
     def record_error(self, error_type: str) -> None:
         """Record error metrics."""
-        self.metrics["errors"]["by_type"][error_type] = self.metrics["errors"]["by_type"].get(error_type, 0) + 1
+        self.errors_by_type[error_type] += 1
+    
+    def _estimate_quantile(self, quantile: float, count: int, max_time: float) -> float:
+        """Estimate a response time quantile from the histogram upper bounds."""
+        if count == 0:
+            return 0.0
+        
+        target = quantile * count
+        cumulative = 0
+        for bucket, bucket_count in enumerate(self.response_time_histogram):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return min((1 << bucket) / 1_000_000, max_time)
+        return max_time
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics."""
-        # Fix infinite min value if no requests recorded
-        if self.metrics["response_times"]["min"] == float('inf'):
-            self.metrics["response_times"]["min"] = 0.0
+        count = self.total_requests
+        max_time = self.max_time
+        
+        response_times = {
+            "total_time": self.total_time,
+            "count": count,
+            # Report 0 rather than infinity if no requests recorded
+            "min": self.min_time if count else 0.0,
+            "max": max_time,
+            "average": self.total_time / count if count else 0.0,
+        }
+        for quantile in RESPONSE_TIME_QUANTILES:
+            response_times[f"p{int(quantile * 100)}"] = self._estimate_quantile(
+                quantile, count, max_time
+            )
+        response_times["histogram"] = [
+            {"le": (1 << bucket) / 1_000_000, "count": bucket_count}
+            for bucket, bucket_count in enumerate(self.response_time_histogram)
+            if bucket_count
+        ]
         
-        return self.metrics.copy()
+        return {
+            "requests": {
+                "total": count,
+                "by_method": dict(self.requests_by_method),
+                "by_status": {str(code): n for code, n in self.requests_by_status.items()},
+                "by_endpoint": dict(self.requests_by_endpoint),
+            },
+            "response_times": response_times,
+            "errors": {
+                "total": self.total_errors,
+                "by_type": dict(self.errors_by_type),
+            }
+        }
     
     def reset_metrics(self) -> None:
         """Reset all metrics."""
@@ -5,12 +5,14 @@ This module provides middleware components for request processing,
 logging, and error tracking with structured logging and performance metrics.
 """
 
+import logging
 import uuid
 import time
 from typing import Callable
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.logging_config import (
     get_logger, 
@@ -22,12 +24,35 @@ from app.core.logging_config import (
 logger = get_logger(__name__)
 
 
+class RequestIdMiddleware:
+    """
+    Minimal ASGI middleware that assigns request and correlation IDs.
+    
+    Registered as the outermost application middleware so the IDs are on
+    ``request.state`` before any other middleware, route or exception
+    handler runs. It does nothing else and never raises.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket"):
+            # One ID serves both purposes: nothing propagates an inbound
+            # correlation ID, so a second uuid4() would only cost entropy
+            request_id = str(uuid.uuid4())
+            state = scope.setdefault("state", {})
+            state["request_id"] = request_id
+            state["correlation_id"] = request_id
+        await self.app(scope, receive, send)
+
+
 class RequestTrackingMiddleware(BaseHTTPMiddleware):
     """
     Enhanced middleware for request tracking, structured logging, and performance metrics.
     
     This middleware:
-    - Adds a unique request ID and correlation ID to each request
+    - Propagates the request and correlation IDs set by RequestIdMiddleware
     - Implements structured logging with correlation IDs
     - Tracks detailed performance metrics
     - Logs comprehensive request/response information
@@ -45,85 +70,94 @@ class RequestTrackingMiddleware(BaseHTTPMiddleware):
         Returns:
             Response with added tracking headers and metrics
         """
-        # Generate unique request ID and correlation ID
-        request_id = str(uuid.uuid4())
-        correlation_id = str(uuid.uuid4())
+        # IDs are assigned by RequestIdMiddleware before we run
+        request_id = request.state.request_id
+        correlation_id = request.state.correlation_id
         
         # Set correlation ID in context
         set_correlation_id(correlation_id)
         
-        # Store IDs in request state
-        request.state.request_id = request_id
-        request.state.correlation_id = correlation_id
-        
-        # Record start time
-        start_time = time.time()
+        # Record start time (monotonic, unaffected by wall-clock changes)
+        start_time = time.perf_counter()
         
         # Extract request information
         method = request.method
         path = request.url.path
-        query_params = str(request.query_params) if request.query_params else None
-        client_ip = request.client.host if request.client else None
-        user_agent = request.headers.get("user-agent")
-        content_length = request.headers.get("content-length")
         
-        # Log request start with structured data
-        logger.info("Request started", extra={
-            "event": "request_started",
-            "request_id": request_id,
-            "method": method,
-            "path": path,
-            "query_params": query_params,
-            "client_ip": client_ip,
-            "user_agent": user_agent,
-            "content_length": content_length,
-            "headers": dict(request.headers) if logger.isEnabledFor(10) else None  # DEBUG level
-        })
+        # Log request start with structured data; the extra fields (and the
+        # header copy, only wanted at DEBUG) are built only if it is emitted
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        if info_enabled:
+            headers = request.headers
+            # Raw (host, port) tuple; request.client would wrap it in an Address
+            client = request.scope.get("client")
+            extra = {
+                "event": "request_started",
+                "request_id": request_id,
+                "method": method,
+                "path": path,
+                "query_params": str(request.query_params) if request.query_params else None,
+                "client_ip": client[0] if client else None,
+                "user_agent": headers.get("user-agent"),
+                "content_length": headers.get("content-length"),
+                "headers": None
+            }
+            if logger.isEnabledFor(logging.DEBUG):
+                extra["headers"] = dict(headers)
+            logger.info("Request started", extra=extra)
         
         try:
             # Process the request
             response = await call_next(request)
             
             # Calculate processing time
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
-            # Add tracking headers to response
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Correlation-ID"] = correlation_id
-            response.headers["X-Processing-Time"] = f"{processing_time:.3f}s"
+            # Add tracking headers to response, appended pre-encoded since
+            # nothing else sets them
+            response.raw_headers.extend((
+                (b"x-request-id", request_id.encode("ascii")),
+                (b"x-correlation-id", correlation_id.encode("ascii")),
+                (b"x-processing-time", b"%.3fs" % processing_time)
+            ))
             
-            # Record metrics
+            # Record metrics against the matched route template (e.g.
+            # "/api/v1/similarity/{session_id}") so per-endpoint counters stay
+            # bounded; unmatched requests fall back to the raw path
+            route = request.scope.get("route")
             performance_metrics.record_request(
                 method=method,
-                endpoint=path,
+                endpoint=route.path if route is not None else path,
                 status_code=response.status_code,
                 processing_time=processing_time
             )
             
             # Log request completion with structured data
-            logger.info("Request completed", extra={
-                "event": "request_completed",
-                "request_id": request_id,
-                "method": method,
-                "path": path,
-                "status_code": response.status_code,
-                "processing_time": processing_time,
-                "response_size": response.headers.get("content-length"),
-                "cache_status": response.headers.get("x-cache-status")
-            })
+            if info_enabled:
+                logger.info("Request completed", extra={
+                    "event": "request_completed",
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "status_code": response.status_code,
+                    "processing_time": processing_time,
+                    "response_size": response.headers.get("content-length"),
+                    "cache_status": response.headers.get("x-cache-status")
+                })
             
             return response
             
         except Exception as exc:
             # Calculate processing time for failed requests
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             exception_type = type(exc).__name__
             exception_message = str(exc)
             
             # Record error metrics
             performance_metrics.record_error(exception_type)
             
-            # Log request failure with structured data
+            # Log request failure with structured data. No traceback here:
+            # generic_exception_handler logs it once for the re-raised error
             logger.error("Request failed", extra={
                 "event": "request_failed",
                 "request_id": request_id,
@@ -132,12 +166,33 @@ class RequestTrackingMiddleware(BaseHTTPMiddleware):
                 "processing_time": processing_time,
                 "exception_type": exception_type,
                 "exception_message": exception_message
-            }, exc_info=True)
+            })
             
             # Re-raise the exception to be handled by exception handlers
             raise
 
 
+# Static response headers, pre-encoded in Starlette's raw (lowercase bytes) form
+_SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"content-security-policy", b"default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+    # API-specific headers
+    (b"x-api-version", b"1.0.0"),
+    (b"x-powered-by", b"FastAPI"),
+)
+
+_API_CACHE_HEADERS = (
+    (b"cache-control", b"no-cache, no-store, must-revalidate"),
+    (b"pragma", b"no-cache"),
+    (b"expires", b"0"),
+)
+
+
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     """
     Middleware to add security headers to responses.
@@ -159,23 +214,12 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         """
         response = await call_next(request)
         
-        # Add comprehensive security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Content-Security-Policy"] = "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-        
-        # Add API-specific headers
-        response.headers["X-API-Version"] = "1.0.0"
-        response.headers["X-Powered-By"] = "FastAPI"
+        # Append the pre-encoded headers in one go; nothing downstream sets
+        # these names, so appending can't produce duplicates
+        response.raw_headers.extend(_SECURITY_HEADERS)
         
         # Add cache control for API responses
         if request.url.path.startswith("/api/"):
-            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
+            response.raw_headers.extend(_API_CACHE_HEADERS)
         
         return response
\ No newline at end of file
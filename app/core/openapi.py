@@ -4,8 +4,12 @@ OpenAPI documentation configuration and customization.
 This module provides enhanced OpenAPI documentation with custom schemas,
 examples, and comprehensive API documentation.
 """
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, List
-from fastapi import FastAPI
+
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.openapi.utils import get_openapi
 
 from app.core.config import settings
@@ -69,152 +73,154 @@ All endpoints return standardized error responses with:
         routes=app.routes,
     )
     
-    # Add custom components
-    openapi_schema["components"]["schemas"].update({
-        "ErrorResponse": {
-            "type": "object",
-            "properties": {
-                "error_code": {
-                    "type": "string",
-                    "description": "Machine-readable error code",
-                    "example": "SESSION_NOT_FOUND"
-                },
-                "message": {
-                    "type": "string",
-                    "description": "Human-readable error message",
-                    "example": "Session with ID 123 not found"
-                },
-                "details": {
-                    "type": "object",
-                    "description": "Additional error details",
-                    "example": {"session_id": 123}
+    # Assemble the custom components, server, info and docs sections as
+    # literals merged over what get_openapi generated
+    components = openapi_schema.get("components", {})
+    openapi_schema["components"] = {
+        **components,
+        "schemas": {
+            **components.get("schemas", {}),
+            "ErrorResponse": {
+                "type": "object",
+                "properties": {
+                    "error_code": {
+                        "type": "string",
+                        "description": "Machine-readable error code",
+                        "example": "SESSION_NOT_FOUND"
+                    },
+                    "message": {
+                        "type": "string",
+                        "description": "Human-readable error message",
+                        "example": "Session with ID 123 not found"
+                    },
+                    "details": {
+                        "type": "object",
+                        "description": "Additional error details",
+                        "example": {"session_id": 123}
+                    },
+                    "timestamp": {
+                        "type": "string",
+                        "format": "date-time",
+                        "description": "Error timestamp in ISO format",
+                        "example": "2023-12-01T10:30:00Z"
+                    },
+                    "request_id": {
+                        "type": "string",
+                        "description": "Unique request identifier for tracking",
+                        "example": "req_123e4567-e89b-12d3-a456-426614174000"
+                    }
                 },
-                "timestamp": {
-                    "type": "string",
-                    "format": "date-time",
-                    "description": "Error timestamp in ISO format",
-                    "example": "2023-12-01T10:30:00Z"
-                },
-                "request_id": {
-                    "type": "string",
-                    "description": "Unique request identifier for tracking",
-                    "example": "req_123e4567-e89b-12d3-a456-426614174000"
-                }
-            },
-            "required": ["error_code", "message", "timestamp", "request_id"]
-        }
-    })
-    
-    # Add security schemes (even though not currently used)
-    openapi_schema["components"]["securitySchemes"] = {
-        "ApiKeyAuth": {
-            "type": "apiKey",
-            "in": "header",
-            "name": "X-API-Key",
-            "description": "API key authentication (not currently implemented)"
-        },
-        "BearerAuth": {
-            "type": "http",
-            "scheme": "bearer",
-            "bearerFormat": "JWT",
-            "description": "JWT bearer token authentication (not currently implemented)"
-        }
-    }
-    
-    # Add custom headers
-    openapi_schema["components"]["parameters"] = {
-        "RequestId": {
-            "name": "X-Request-ID",
-            "in": "header",
-            "description": "Optional request ID for tracking",
-            "required": False,
-            "schema": {
-                "type": "string",
-                "format": "uuid"
+                "required": ["error_code", "message", "timestamp", "request_id"]
             }
         },
-        "CorrelationId": {
-            "name": "X-Correlation-ID", 
-            "in": "header",
-            "description": "Optional correlation ID for distributed tracing",
-            "required": False,
-            "schema": {
-                "type": "string",
-                "format": "uuid"
-            }
-        }
-    }
-    
-    # Add response headers
-    openapi_schema["components"]["headers"] = {
-        "X-Request-ID": {
-            "description": "Unique request identifier",
-            "schema": {
-                "type": "string",
-                "format": "uuid"
-            }
-        },
-        "X-Correlation-ID": {
-            "description": "Correlation ID for request tracking",
-            "schema": {
-                "type": "string", 
-                "format": "uuid"
-            }
-        },
-        "X-Processing-Time": {
-            "description": "Request processing time in seconds",
-            "schema": {
-                "type": "string",
-                "pattern": "^\\d+\\.\\d{3}s$"
+        # Security schemes (even though not currently used)
+        "securitySchemes": {
+            "ApiKeyAuth": {
+                "type": "apiKey",
+                "in": "header",
+                "name": "X-API-Key",
+                "description": "API key authentication (not currently implemented)"
+            },
+            "BearerAuth": {
+                "type": "http",
+                "scheme": "bearer",
+                "bearerFormat": "JWT",
+                "description": "JWT bearer token authentication (not currently implemented)"
             }
         },
-        "X-API-Version": {
-            "description": "API version",
-            "schema": {
-                "type": "string"
-            }
-        }
-    }
-    
-    # Add examples for common responses
-    openapi_schema["components"]["examples"] = {
-        "SessionNotFoundError": {
-            "summary": "Session not found",
-            "value": {
-                "error_code": "SESSION_NOT_FOUND",
-                "message": "Session with ID 123 not found",
-                "details": {"session_id": 123},
-                "timestamp": "2023-12-01T10:30:00Z",
-                "request_id": "req_123e4567-e89b-12d3-a456-426614174000"
+        # Custom request headers
+        "parameters": {
+            "RequestId": {
+                "name": "X-Request-ID",
+                "in": "header",
+                "description": "Optional request ID for tracking",
+                "required": False,
+                "schema": {
+                    "type": "string",
+                    "format": "uuid"
+                }
+            },
+            "CorrelationId": {
+                "name": "X-Correlation-ID", 
+                "in": "header",
+                "description": "Optional correlation ID for distributed tracing",
+                "required": False,
+                "schema": {
+                    "type": "string",
+                    "format": "uuid"
+                }
             }
         },
-        "ValidationError": {
-            "summary": "Request validation error",
-            "value": {
-                "error_code": "REQUEST_VALIDATION_ERROR",
-                "message": "Request validation failed",
-                "details": {
-                    "validation_errors": [
-                        {
-                            "field": "audio",
-                            "message": "field required",
-                            "type": "value_error.missing"
-                        }
-                    ],
-                    "error_count": 1
-                },
-                "timestamp": "2023-12-01T10:30:00Z",
-                "request_id": "req_123e4567-e89b-12d3-a456-426614174000"
+        # Response headers
+        "headers": {
+            "X-Request-ID": {
+                "description": "Unique request identifier",
+                "schema": {
+                    "type": "string",
+                    "format": "uuid"
+                }
+            },
+            "X-Correlation-ID": {
+                "description": "Correlation ID for request tracking",
+                "schema": {
+                    "type": "string", 
+                    "format": "uuid"
+                }
+            },
+            "X-Processing-Time": {
+                "description": "Request processing time in seconds",
+                "schema": {
+                    "type": "string",
+                    "pattern": "^\\d+\\.\\d{3}s$"
+                }
+            },
+            "X-API-Version": {
+                "description": "API version",
+                "schema": {
+                    "type": "string"
+                }
             }
         },
-        "InternalServerError": {
-            "summary": "Internal server error",
-            "value": {
-                "error_code": "INTERNAL_SERVER_ERROR",
-                "message": "An unexpected error occurred",
-                "details": {"exception_type": "ValueError"},
-                "timestamp": "2023-12-01T10:30:00Z",
-                "request_id": "req_123e4567-e89b-12d3-a456-426614174000"
+        # Examples for common responses
+        "examples": {
+            "SessionNotFoundError": {
+                "summary": "Session not found",
+                "value": {
+                    "error_code": "SESSION_NOT_FOUND",
+                    "message": "Session with ID 123 not found",
+                    "details": {"session_id": 123},
+                    "timestamp": "2023-12-01T10:30:00Z",
+                    "request_id": "req_123e4567-e89b-12d3-a456-426614174000"
+                }
+            },
+            "ValidationError": {
+                "summary": "Request validation error",
+                "value": {
+                    "error_code": "REQUEST_VALIDATION_ERROR",
+                    "message": "Request validation failed",
+                    "details": {
+                        "validation_errors": [
+                            {
+                                "field": "audio",
+                                "message": "field required",
+                                "type": "value_error.missing"
+                            }
+                        ],
+                        "error_count": 1
+                    },
+                    "timestamp": "2023-12-01T10:30:00Z",
+                    "request_id": "req_123e4567-e89b-12d3-a456-426614174000"
+                }
+            },
+            "InternalServerError": {
+                "summary": "Internal server error",
+                "value": {
+                    "error_code": "INTERNAL_SERVER_ERROR",
+                    "message": "An unexpected error occurred",
+                    "details": {"exception_type": "ValueError"},
+                    "timestamp": "2023-12-01T10:30:00Z",
+                    "request_id": "req_123e4567-e89b-12d3-a456-426614174000"
+                }
             }
         }
     }
@@ -232,15 +238,17 @@ All endpoints return standardized error responses with:
     ]
     
     # Add contact and license information
-    openapi_schema["info"]["contact"] = {
-        "name": "Speech Similarity API Support",
-        "email": "support@example.com",
-        "url": "https://example.com/support"
-    }
-    
-    openapi_schema["info"]["license"] = {
-        "name": "MIT",
-        "url": "https://opensource.org/licenses/MIT"
+    openapi_schema["info"] = {
+        **openapi_schema["info"],
+        "contact": {
+            "name": "Speech Similarity API Support",
+            "email": "support@example.com",
+            "url": "https://example.com/support"
+        },
+        "license": {
+            "name": "MIT",
+            "url": "https://opensource.org/licenses/MIT"
+        }
     }
     
     # Add external documentation
@@ -260,16 +268,43 @@ def setup_openapi_documentation(app: FastAPI) -> None:
     Args:
         app: FastAPI application instance
     """
-    app.openapi = lambda: custom_openapi_schema(app)
+    @lru_cache(maxsize=1)
+    def cached_openapi() -> Dict[str, Any]:
+        # Built on first call (or at startup), then returned by identity
+        return custom_openapi_schema(app)
+    
+    app.openapi = cached_openapi
+    
+    # Replace FastAPI's default schema route, which re-encodes the dict on
+    # every request, with one serving bytes encoded once
+    openapi_url = app.openapi_url
+    if openapi_url:
+        app.router.routes = [
+            route for route in app.router.routes
+            if getattr(route, "path", None) != openapi_url
+        ]
+        
+        @lru_cache(maxsize=1)
+        def openapi_bytes() -> bytes:
+            return orjson.dumps(app.openapi(), option=orjson.OPT_NON_STR_KEYS)
+        
+        async def openapi_json(request: Request) -> Response:
+            return Response(content=openapi_bytes(), media_type="application/json")
+        
+        app.add_route(openapi_url, openapi_json, include_in_schema=False)
+
 
+# Shared by every common response entry instead of one copy per status
+_ERROR_SCHEMA = {"$ref": "#/components/schemas/ErrorResponse"}
 
-# Common response examples for reuse across endpoints
-COMMON_RESPONSES = {
+# Common response examples for reuse across endpoints (read-only; spread
+# into a route's ``responses`` rather than mutating it)
+COMMON_RESPONSES = MappingProxyType({
     400: {
         "description": "Bad Request",
         "content": {
             "application/json": {
-                "schema": {"$ref": "#/components/schemas/ErrorResponse"},
+                "schema": _ERROR_SCHEMA,
                 "example": {
                     "error_code": "BAD_REQUEST",
                     "message": "Invalid request format",
@@ -284,7 +319,7 @@ COMMON_RESPONSES = {
         "description": "Validation Error",
         "content": {
             "application/json": {
-                "schema": {"$ref": "#/components/schemas/ErrorResponse"},
+                "schema": _ERROR_SCHEMA,
                 "examples": {
                     "validation_error": {"$ref": "#/components/examples/ValidationError"}
                 }
@@ -295,7 +330,7 @@ COMMON_RESPONSES = {
         "description": "Internal Server Error",
         "content": {
             "application/json": {
-                "schema": {"$ref": "#/components/schemas/ErrorResponse"},
+                "schema": _ERROR_SCHEMA,
                 "examples": {
                     "internal_error": {"$ref": "#/components/examples/InternalServerError"}
                 }
@@ -306,7 +341,7 @@ COMMON_RESPONSES = {
         "description": "Service Unavailable",
         "content": {
             "application/json": {
-                "schema": {"$ref": "#/components/schemas/ErrorResponse"},
+                "schema": _ERROR_SCHEMA,
                 "example": {
                     "error_code": "SERVICE_UNAVAILABLE",
                     "message": "Database service is temporarily unavailable",
@@ -317,4 +352,4 @@ COMMON_RESPONSES = {
             }
         }
     }
-}
\ No newline at end of file
+})
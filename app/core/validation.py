@@ -4,7 +4,7 @@ Enhanced request validation and response serialization utilities.
 This module provides comprehensive validation middleware and utilities
 for ensuring data integrity and proper serialization.
 """
-import json
+import binascii
 from typing import Any, Dict, Optional, Union
 from datetime import datetime
 from decimal import Decimal
@@ -14,41 +14,61 @@ from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel, ValidationError
 from starlette.middleware.base import BaseHTTPMiddleware
 
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 from app.core.logging_config import get_logger
 from app.core.exceptions import ValidationError as CustomValidationError
 
 logger = get_logger(__name__)
 
 
-class EnhancedJSONEncoder(json.JSONEncoder):
+def json_default(obj: Any) -> Any:
     """
-    Enhanced JSON encoder that handles additional Python types.
+    Convert non-serializable objects to JSON-serializable format.
     
-    This encoder properly serializes datetime objects, Decimal numbers,
-    and other common Python types that aren't natively JSON serializable.
-    """
+    Intended as the ``default`` hook for ``orjson.dumps``, which already
+    handles datetime, UUID and dataclasses natively in C and only calls
+    this for the remaining types.
     
-    def default(self, obj: Any) -> Any:
-        """
-        Convert non-serializable objects to JSON-serializable format.
+    Args:
+        obj: Object to serialize
         
-        Args:
-            obj: Object to serialize
-            
-        Returns:
-            JSON-serializable representation of the object
-        """
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, Decimal):
-            return float(obj)
-        elif hasattr(obj, '__dict__'):
-            return obj.__dict__
-        elif hasattr(obj, 'dict') and callable(obj.dict):
-            # Handle Pydantic models
-            return obj.dict()
+    Returns:
+        JSON-serializable representation of the object
         
-        return super().default(obj)
+    Raises:
+        TypeError: If the object cannot be converted
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    elif isinstance(obj, Decimal):
+        return float(obj)
+    elif isinstance(obj, BaseModel):
+        # Checked before __dict__ so nested models are dumped properly
+        return obj.model_dump()
+    elif hasattr(obj, '__dict__'):
+        return obj.__dict__
+    
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+
+def _is_supported_content_type(content_type: str) -> bool:
+    """
+    Check whether a request content type is JSON or multipart form data.
+    
+    Clients almost always send lowercase media types, so the case-folded
+    comparison only runs when the direct check misses.
+    """
+    if content_type.startswith('application/json') or 'multipart/form-data' in content_type:
+        return True
+    content_type = content_type.lower()
+    return 'application/json' in content_type or 'multipart/form-data' in content_type
 
 
 class RequestValidationMiddleware(BaseHTTPMiddleware):
@@ -82,31 +102,28 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
         Returns:
             Response from the next handler
         """
-        request_id = getattr(request.state, 'request_id', 'unknown')
-        
         try:
             # Validate request size
             content_length = request.headers.get('content-length')
-            if content_length:
+            if content_length and int(content_length) > self.max_request_size:
                 content_length = int(content_length)
-                if content_length > self.max_request_size:
-                    logger.warning(f"Request size {content_length} exceeds limit {self.max_request_size}", extra={
-                        "request_id": request_id,
-                        "content_length": content_length,
-                        "max_size": self.max_request_size
-                    })
-                    raise CustomValidationError(
-                        error_code="REQUEST_TOO_LARGE",
-                        message=f"Request size {content_length} bytes exceeds maximum allowed size {self.max_request_size} bytes",
-                        details={"content_length": content_length, "max_size": self.max_request_size}
-                    )
+                logger.warning("Request size %s exceeds limit %s", content_length, self.max_request_size, extra={
+                    "request_id": request.state.request_id,
+                    "content_length": content_length,
+                    "max_size": self.max_request_size
+                })
+                raise CustomValidationError(
+                    error_code="REQUEST_TOO_LARGE",
+                    message=f"Request size {content_length} bytes exceeds maximum allowed size {self.max_request_size} bytes",
+                    details={"content_length": content_length, "max_size": self.max_request_size}
+                )
             
             # Validate content type for POST/PUT requests
-            if request.method in ["POST", "PUT", "PATCH"]:
-                content_type = request.headers.get('content-type', '').lower()
-                if content_type and not any(ct in content_type for ct in ['application/json', 'multipart/form-data']):
-                    logger.warning(f"Unsupported content type: {content_type}", extra={
-                        "request_id": request_id,
+            if request.method in _BODY_METHODS:
+                content_type = request.headers.get('content-type')
+                if content_type and not _is_supported_content_type(content_type):
+                    logger.warning("Unsupported content type: %s", content_type, extra={
+                        "request_id": request.state.request_id,
                         "content_type": content_type,
                         "method": request.method
                     })
@@ -124,8 +141,8 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
             # Re-raise custom validation errors
             raise
         except Exception as e:
-            logger.error(f"Validation middleware error: {e}", extra={
-                "request_id": request_id,
+            logger.error("Validation middleware error: %s", e, extra={
+                "request_id": request.state.request_id,
                 "exception_type": type(e).__name__
             })
             raise
@@ -146,16 +163,17 @@ def validate_model_data(model_class: type[BaseModel], data: Dict[str, Any]) -> B
         CustomValidationError: If validation fails
     """
     try:
-        return model_class(**data)
+        return model_class.model_validate(data)
     except ValidationError as e:
-        validation_errors = []
-        for error in e.errors():
-            validation_errors.append({
-                "field": ".".join(str(loc) for loc in error["loc"]),
+        validation_errors = [
+            {
+                "field": ".".join(map(str, error["loc"])),
                 "message": error["msg"],
                 "type": error["type"],
                 "input": error.get("input")
-            })
+            }
+            for error in e.errors()
+        ]
         
         raise CustomValidationError(
             error_code="MODEL_VALIDATION_ERROR",
@@ -168,6 +186,15 @@ def validate_model_data(model_class: type[BaseModel], data: Dict[str, Any]) -> B
         )
 
 
+def _to_jsonable(value: Any) -> Any:
+    """Convert datetime and Decimal values for JSON; pass others through."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
 def serialize_response(data: Any, exclude_none: bool = True) -> Dict[str, Any]:
     """
     Serialize response data with enhanced handling.
@@ -182,27 +209,29 @@ def serialize_response(data: Any, exclude_none: bool = True) -> Dict[str, Any]:
     try:
         if isinstance(data, BaseModel):
             # Use Pydantic's serialization for models
-            return data.dict(exclude_none=exclude_none)
+            return data.model_dump(exclude_none=exclude_none)
         elif hasattr(data, '__dict__'):
-            # Handle regular Python objects
-            result = {}
-            for key, value in data.__dict__.items():
-                if exclude_none and value is None:
-                    continue
-                if isinstance(value, (datetime, Decimal)):
-                    result[key] = EnhancedJSONEncoder().default(value)
-                else:
-                    result[key] = value
-            return result
+            # Handle regular Python objects; pick the filter once rather
+            # than testing exclude_none per field
+            items = vars(data).items()
+            if exclude_none:
+                return {key: _to_jsonable(value) for key, value in items if value is not None}
+            return {key: _to_jsonable(value) for key, value in items}
         else:
             # Use FastAPI's jsonable_encoder as fallback
             return jsonable_encoder(data, exclude_none=exclude_none)
     except Exception as e:
-        logger.error(f"Response serialization error: {e}")
+        logger.error("Response serialization error: %s", e)
         # Return a safe fallback
         return {"error": "Serialization failed", "data_type": str(type(data))}
 
 
+# Common audio file signatures, bucketed by length for direct prefix lookups
+_AUDIO_HEADERS_4 = {b'RIFF': 'WAV', b'fLaC': 'FLAC', b'OggS': 'OGG'}
+_AUDIO_HEADERS_3 = {b'ID3': 'MP3'}
+_AUDIO_HEADERS_2 = {b'\xff\xfb': 'MP3', b'\xff\xf3': 'MP3', b'\xff\xf2': 'MP3'}
+
+
 def validate_audio_data(audio_data: str, max_size_mb: int = 25) -> None:
     """
     Validate base64-encoded audio data.
@@ -214,43 +243,34 @@ def validate_audio_data(audio_data: str, max_size_mb: int = 25) -> None:
     Raises:
         CustomValidationError: If validation fails
     """
-    import base64
+    # Check size from the encoded length so oversized payloads are rejected
+    # without allocating the decoded bytes
+    padding = 2 if audio_data.endswith('==') else 1 if audio_data.endswith('=') else 0
+    size_mb = ((len(audio_data) * 3) // 4 - padding) / (1024 * 1024)
+    if size_mb > max_size_mb:
+        raise CustomValidationError(
+            error_code="AUDIO_SIZE_EXCEEDED",
+            message=f"Audio size {size_mb:.2f}MB exceeds maximum allowed size {max_size_mb}MB",
+            details={"size_mb": size_mb, "max_size_mb": max_size_mb}
+        )
     
     try:
         # Validate base64 format
         decoded_data = base64.b64decode(audio_data, validate=True)
         
-        # Check size
-        size_mb = len(decoded_data) / (1024 * 1024)
-        if size_mb > max_size_mb:
-            raise CustomValidationError(
-                error_code="AUDIO_SIZE_EXCEEDED",
-                message=f"Audio size {size_mb:.2f}MB exceeds maximum allowed size {max_size_mb}MB",
-                details={"size_mb": size_mb, "max_size_mb": max_size_mb}
-            )
-        
         # Basic audio format validation (check for common audio headers)
-        audio_headers = {
-            b'RIFF': 'WAV',
-            b'ID3': 'MP3',
-            b'\xff\xfb': 'MP3',
-            b'\xff\xf3': 'MP3',
-            b'\xff\xf2': 'MP3',
-            b'fLaC': 'FLAC',
-            b'OggS': 'OGG'
-        }
-        
-        format_detected = False
-        for header, format_name in audio_headers.items():
-            if decoded_data.startswith(header):
-                format_detected = True
-                logger.debug(f"Detected audio format: {format_name}")
-                break
+        format_name = (
+            _AUDIO_HEADERS_4.get(decoded_data[:4])
+            or _AUDIO_HEADERS_3.get(decoded_data[:3])
+            or _AUDIO_HEADERS_2.get(decoded_data[:2])
+        )
         
-        if not format_detected:
+        if format_name:
+            logger.debug("Detected audio format: %s", format_name)
+        else:
             logger.warning("Could not detect audio format from headers")
         
-    except base64.binascii.Error:
+    except binascii.Error:
         raise CustomValidationError(
             error_code="INVALID_AUDIO_ENCODING",
             message="Audio data is not valid base64 encoding",
@@ -274,7 +294,12 @@ def validate_similarity_score(score: float) -> None:
     Raises:
         CustomValidationError: If score is invalid
     """
-    if not isinstance(score, (int, float)):
+    # Exact-type fast path; the isinstance fallback admits float subclasses
+    # such as numpy.float64 but, unlike before, rejects bool
+    score_type = type(score)
+    if score_type is not float and score_type is not int and (
+        score_type is bool or not isinstance(score, (int, float))
+    ):
         raise CustomValidationError(
             error_code="INVALID_SIMILARITY_SCORE_TYPE",
             message="Similarity score must be a number",
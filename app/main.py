@@ -1,8 +1,12 @@
 """
 FastAPI application entry point for Speech Similarity API.
 """
+from functools import lru_cache
+from typing import List
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import ValidationError
@@ -18,14 +22,39 @@ from app.core.exception_handlers import (
     pydantic_validation_exception_handler,
     generic_exception_handler
 )
-from app.core.middleware import RequestTrackingMiddleware, SecurityHeadersMiddleware
+from app.core.middleware import RequestIdMiddleware, RequestTrackingMiddleware, SecurityHeadersMiddleware
 from app.core.validation import RequestValidationMiddleware
-from app.core.openapi import setup_openapi_documentation
 
 # Initialize logging
 setup_logging()
 logger = get_logger(__name__)
 
+# CORS header lists, shared rather than rebuilt for each app instance
+_CORS_ALLOW_HEADERS = (
+    "Accept",
+    "Accept-Language",
+    "Content-Language",
+    "Content-Type",
+    "Authorization",
+    "X-Request-ID",
+    "X-Correlation-ID"
+)
+_CORS_EXPOSE_HEADERS = (
+    "X-Request-ID",
+    "X-Correlation-ID",
+    "X-Processing-Time",
+    "X-API-Version"
+)
+
+
+@lru_cache(maxsize=1)
+def _cors_origins() -> List[str]:
+    """Parse the configured CORS origins once, ignoring surrounding whitespace."""
+    origins = settings.cors_origins
+    if origins == "*":
+        return ["*"]
+    return [origin.strip() for origin in origins.split(",") if origin.strip()]
+
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
@@ -42,6 +71,7 @@ def create_app() -> FastAPI:
         version=settings.app_version,
         description="A FastAPI service for calculating similarity between speech transcriptions and reference text using OpenAI embeddings",
         debug=settings.debug,
+        default_response_class=ORJSONResponse,
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
         openapi_url="/openapi.json" if settings.debug else None,
@@ -83,35 +113,25 @@ def create_app() -> FastAPI:
         ]
     )
 
-    # Add middleware (order matters - first added is outermost)
+    # Add middleware (order matters - last added is outermost)
     app.add_middleware(SecurityHeadersMiddleware)
     app.add_middleware(RequestValidationMiddleware, max_request_size=settings.max_audio_size_mb * 1024 * 1024)
     app.add_middleware(RequestTrackingMiddleware)
     
     # Enhanced CORS middleware configuration
-    cors_origins = settings.cors_origins.split(",") if settings.cors_origins != "*" else ["*"]
+    cors_origins = _cors_origins()
     app.add_middleware(
         CORSMiddleware,
         allow_origins=cors_origins,
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-        allow_headers=[
-            "Accept",
-            "Accept-Language",
-            "Content-Language",
-            "Content-Type",
-            "Authorization",
-            "X-Request-ID",
-            "X-Correlation-ID"
-        ],
-        expose_headers=[
-            "X-Request-ID",
-            "X-Correlation-ID",
-            "X-Processing-Time",
-            "X-API-Version"
-        ],
+        allow_headers=_CORS_ALLOW_HEADERS,
+        expose_headers=_CORS_EXPOSE_HEADERS,
         max_age=600,  # Cache preflight requests for 10 minutes
     )
+    
+    # Added last so it is outermost: request IDs exist before anything else runs
+    app.add_middleware(RequestIdMiddleware)
 
     # Register exception handlers (order matters - most specific first)
     app.add_exception_handler(SpeechSimilarityAPIError, speech_similarity_api_exception_handler)
@@ -124,8 +144,11 @@ def create_app() -> FastAPI:
     # Include API router
     app.include_router(api_router, prefix="/api/v1")
     
-    # Setup enhanced OpenAPI documentation
-    setup_openapi_documentation(app)
+    # Setup enhanced OpenAPI documentation; the schema is only served when
+    # docs are enabled, so skip importing the builder otherwise
+    if app.openapi_url:
+        from app.core.openapi import setup_openapi_documentation
+        setup_openapi_documentation(app)
     
     # Add startup and shutdown event handlers
     @app.on_event("startup")
@@ -145,13 +168,24 @@ def create_app() -> FastAPI:
             await db_client.get_pool()
             logger.info("Database connection pool initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize database connection pool: {e}")
+            logger.error("Failed to initialize database connection pool: %s", e)
             # In production, you might want to continue without DB for health checks
             if not settings.debug:
                 logger.warning("Continuing startup without database connection")
             else:
                 raise
         
+        # Audio, embedding and similarity services are created on first use
+        # by their dependency factories (see app.core.dependencies)
+        
+        # Build the OpenAPI schema now so the first docs request isn't slow
+        if app.openapi_url:
+            app.openapi()
+        
+        # Establish the CPU usage baseline and start background disk sampling
+        from app.api.v1.endpoints.monitoring import start_system_metrics_sampling
+        start_system_metrics_sampling()
+        
         logger.info("Application startup completed successfully", extra={
             "event": "app_startup_complete"
         })
@@ -164,13 +198,23 @@ def create_app() -> FastAPI:
         })
         
         # Cleanup resources
+        from app.api.v1.endpoints.monitoring import stop_system_metrics_sampling
+        await stop_system_metrics_sampling()
+        
+        embedding_service = getattr(app.state, 'embedding_service', None)
+        if embedding_service is not None:
+            try:
+                await embedding_service.close()
+            except Exception as e:
+                logger.warning("Error closing embedding service: %s", e)
+        
         try:
             from app.core.database import get_database_client
             db_client = get_database_client()
             await db_client.disconnect()
             logger.info("Resource cleanup completed")
         except Exception as e:
-            logger.error(f"Error during resource cleanup: {e}")
+            logger.error("Error during resource cleanup: %s", e)
         
         logger.info("Application shutdown completed", extra={
             "event": "app_shutdown_complete"
@@ -4,7 +4,7 @@
 from .database import SessionRecord
 
 # Request models
-from .requests import SimilarityRequest, AudioUpdateRequest
+from .requests import SimilarityRequest
 
 # Response models
 from .responses import (
@@ -28,7 +28,6 @@ __all__ = [
     
     # Request models
     "SimilarityRequest",
-    "AudioUpdateRequest",
     
     # Response models
     "SimilarityResponse",
@@ -2,7 +2,14 @@
 
 from datetime import datetime
 from typing import Optional, Dict, Any, Union, List
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+def normalize_questions(v):
+    """Convert list-format questions to a dict with indexed keys (q1, q2, ...)."""
+    if isinstance(v, list):
+        return {f"q{i+1}": item for i, item in enumerate(v)}
+    return v
 
 
 class SessionRecord(BaseModel):
@@ -21,22 +28,10 @@ class SessionRecord(BaseModel):
     @classmethod
     def validate_questions(cls, v):
         """Accept both dict and list formats for questions field."""
-        if v is None:
-            return None
-        # If it's already a dict, return as-is
-        if isinstance(v, dict):
-            return v
-        # If it's a list, convert to dict with indexed keys
-        if isinstance(v, list):
-            return {f"q{i+1}": item for i, item in enumerate(v)}
-        return v
+        return normalize_questions(v)
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 123,
                 "speech": "This is the transcribed speech content from the audio file using OpenAI Whisper. The user was discussing the main topic and how it relates to various concepts.",
@@ -45,4 +40,5 @@ class SessionRecord(BaseModel):
                 "generated_by": "speech-api-v1",
                 "created_at": "2023-10-31T10:30:00Z"
             }
-        }
\ No newline at end of file
+        }
+    )
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 from .database import SessionRecord
 
@@ -22,12 +22,13 @@ class SimilarityResponse(BaseModel):
     processing_time_ms: int = Field(..., description="Total processing time in milliseconds")
     timestamp: datetime = Field(..., description="Response generation timestamp")
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        json_schema_extra = {
+    @field_serializer('timestamp', when_used='json')
+    def serialize_timestamp(self, v: datetime) -> str:
+        """Serialize the timestamp as ISO 8601."""
+        return v.isoformat()
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "session_id": 123,
                 "session_data": {
@@ -44,6 +45,7 @@ class SimilarityResponse(BaseModel):
                 "timestamp": "2023-10-31T10:35:00Z"
             }
         }
+    )
 
 
 class AudioUpdateResponse(BaseModel):
@@ -53,18 +55,20 @@ class AudioUpdateResponse(BaseModel):
     message: str = Field(..., description="Success message")
     updated_at: datetime = Field(..., description="Timestamp when update occurred")
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        json_schema_extra = {
+    @field_serializer('updated_at', when_used='json')
+    def serialize_updated_at(self, v: datetime) -> str:
+        """Serialize the timestamp as ISO 8601."""
+        return v.isoformat()
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "session_id": 123,
                 "message": "Audio transcribed and session updated successfully",
                 "updated_at": "2023-10-31T10:35:00Z"
             }
         }
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -76,12 +80,13 @@ class ErrorResponse(BaseModel):
     timestamp: datetime = Field(..., description="Error occurrence timestamp")
     request_id: str = Field(..., description="Unique request identifier for tracking")
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        json_schema_extra = {
+    @field_serializer('timestamp', when_used='json')
+    def serialize_timestamp(self, v: datetime) -> str:
+        """Serialize the timestamp as ISO 8601."""
+        return v.isoformat()
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "error_code": "SESSION_NOT_FOUND",
                 "message": "Session with ID 123 was not found",
@@ -90,6 +95,7 @@ class ErrorResponse(BaseModel):
                 "request_id": "req_abc123def456"
             }
         }
+    )
 
 
 class HealthResponse(BaseModel):
@@ -100,12 +106,13 @@ class HealthResponse(BaseModel):
     version: str = Field(..., description="API version")
     dependencies: Dict[str, str] = Field(..., description="Status of external dependencies")
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        json_schema_extra = {
+    @field_serializer('timestamp', when_used='json')
+    def serialize_timestamp(self, v: datetime) -> str:
+        """Serialize the timestamp as ISO 8601."""
+        return v.isoformat()
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "timestamp": "2023-10-31T10:35:00Z",
@@ -116,6 +123,7 @@ class HealthResponse(BaseModel):
                 }
             }
         }
+    )
 
 
 class MetricsResponse(BaseModel):
@@ -128,12 +136,13 @@ class MetricsResponse(BaseModel):
     errors: Dict[str, Any] = Field(..., description="Error statistics")
     system: Dict[str, Any] = Field(..., description="System resource metrics")
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        json_schema_extra = {
+    @field_serializer('timestamp', when_used='json')
+    def serialize_timestamp(self, v: datetime) -> str:
+        """Serialize the timestamp as ISO 8601."""
+        return v.isoformat()
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "timestamp": "2023-10-31T10:35:00Z",
                 "uptime_seconds": 3600.5,
@@ -141,14 +150,23 @@ class MetricsResponse(BaseModel):
                     "total": 150,
                     "by_method": {"GET": 100, "POST": 50},
                     "by_status": {"200": 140, "404": 8, "500": 2},
-                    "by_endpoint": {"/api/v1/similarity/123": 45, "/api/v1/health": 100}
+                    "by_endpoint": {"/api/v1/similarity/{session_id}": 45, "/api/v1/health": 100}
                 },
                 "response_times": {
                     "total_time": 125.5,
                     "count": 150,
                     "average": 0.837,
                     "min": 0.001,
-                    "max": 5.234
+                    "max": 5.234,
+                    "p50": 0.524288,
+                    "p95": 4.194304,
+                    "p99": 5.234,
+                    "histogram": [
+                        {"le": 0.001024, "count": 3},
+                        {"le": 0.524288, "count": 80},
+                        {"le": 1.048576, "count": 52},
+                        {"le": 8.388608, "count": 15}
+                    ]
                 },
                 "errors": {
                     "total": 10,
@@ -165,6 +183,7 @@ class MetricsResponse(BaseModel):
                 }
             }
         }
+    )
 
 
 class SystemHealthResponse(BaseModel):
@@ -178,12 +197,13 @@ class SystemHealthResponse(BaseModel):
     system_resources: Dict[str, Any] = Field(..., description="System resource usage")
     performance_summary: Dict[str, Any] = Field(..., description="Performance summary metrics")
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        json_schema_extra = {
+    @field_serializer('timestamp', when_used='json')
+    def serialize_timestamp(self, v: datetime) -> str:
+        """Serialize the timestamp as ISO 8601."""
+        return v.isoformat()
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "timestamp": "2023-10-31T10:35:00Z",
                 "status": "healthy",
@@ -212,4 +232,5 @@ class SystemHealthResponse(BaseModel):
                     "requests_per_minute": 2.5
                 }
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
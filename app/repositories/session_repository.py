@@ -3,14 +3,27 @@ Session repository for database operations using Supabase Session Pooler.
 """
 from app.core.logging_config import get_logger
 from typing import Optional, List
-from datetime import datetime
-import json
-from app.models.database import SessionRecord
+from app.models.database import SessionRecord, normalize_questions
 from app.core.database import DatabaseClient
 
 logger = get_logger(__name__)
 
 
+def _record_from_row(row) -> SessionRecord:
+    """
+    Build a SessionRecord from a trusted database row without re-validation.
+    
+    Rows come from Postgres already typed by asyncpg, so the model is built
+    with model_construct and only the questions normalization is applied.
+    """
+    session_data = dict(row)
+    
+    # JSONB is decoded by the connection codec (see _init_connection)
+    session_data['questions'] = normalize_questions(session_data.get('questions'))
+    
+    return SessionRecord.model_construct(**session_data)
+
+
 class SessionRepository:
     """Repository for session data access operations using PostgreSQL connection."""
     
@@ -32,29 +45,22 @@ class SessionRepository:
             Exception: If database operation fails
         """
         try:
-            logger.debug(f"Retrieving session with ID: {session_id}")
+            logger.debug("Retrieving session with ID: %s", session_id)
             
             query = f"SELECT * FROM {self.table_name} WHERE id = $1"
             result = await self.db_client.execute_query(query, session_id)
             
             if not result:
-                logger.info(f"Session not found with ID: {session_id}")
+                logger.info("Session not found with ID: %s", session_id)
                 return None
             
-            # Convert asyncpg Record to dict
-            session_data = dict(result[0])
-            
-            # Handle JSONB fields
-            if session_data.get('questions') and isinstance(session_data['questions'], str):
-                session_data['questions'] = json.loads(session_data['questions'])
+            session_record = _record_from_row(result[0])
             
-            session_record = SessionRecord(**session_data)
-            
-            logger.debug(f"Successfully retrieved session: {session_id}")
+            logger.debug("Successfully retrieved session: %s", session_id)
             return session_record
             
         except Exception as e:
-            logger.error(f"Failed to retrieve session {session_id}: {e}")
+            logger.error("Failed to retrieve session %s: %s", session_id, e)
             raise
     
     async def update_speech(self, session_id: int, speech_text: str) -> bool:
@@ -72,21 +78,21 @@ class SessionRepository:
             Exception: If database operation fails
         """
         try:
-            logger.debug(f"Updating transcribed text for session: {session_id}")
+            logger.debug("Updating transcribed text for session: %s", session_id)
             
             query = f"UPDATE {self.table_name} SET audio = $1 WHERE id = $2"
             result = await self.db_client.execute_command(query, speech_text, session_id)
             
             # Check if any rows were affected
             if result == "UPDATE 0":
-                logger.warning(f"No session found to update with ID: {session_id}")
+                logger.warning("No session found to update with ID: %s", session_id)
                 return False
             
-            logger.info(f"Successfully updated transcribed text for session: {session_id}")
+            logger.info("Successfully updated transcribed text for session: %s", session_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to update transcribed text for session {session_id}: {e}")
+            logger.error("Failed to update transcribed text for session %s: %s", session_id, e)
             raise
     
     async def create(self, session_data: dict) -> SessionRecord:
@@ -105,26 +111,20 @@ class SessionRepository:
         try:
             logger.debug("Creating new session record")
             
-            # Ensure created_at is set
-            if "created_at" not in session_data:
-                session_data["created_at"] = datetime.utcnow()
-            
-            # Handle JSONB fields
-            questions_json = json.dumps(session_data.get('questions', {})) if session_data.get('questions') else None
-            
+            # created_at defaults to the database clock when not supplied
             query = f"""
                 INSERT INTO {self.table_name} (speech, questions, created_by, generated_by, created_at, audio, original_paper)
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
+                VALUES ($1, $2, $3, $4, COALESCE($5::timestamptz, now()), $6, $7)
                 RETURNING *
             """
             
             result = await self.db_client.execute_query(
                 query,
                 session_data.get('speech'),
-                questions_json,
+                session_data.get('questions') or None,
                 session_data.get('created_by'),
                 session_data.get('generated_by'),
-                session_data['created_at'],
+                session_data.get('created_at'),
                 session_data.get('audio'),
                 session_data.get('original_paper')
             )
@@ -132,17 +132,67 @@ class SessionRepository:
             if not result:
                 raise Exception("Failed to create session - no data returned")
             
-            # Convert result to dict and handle JSONB
-            created_data = dict(result[0])
-            if created_data.get('questions') and isinstance(created_data['questions'], str):
-                created_data['questions'] = json.loads(created_data['questions'])
-            
-            created_session = SessionRecord(**created_data)
-            logger.info(f"Successfully created session with ID: {created_session.id}")
+            created_session = _record_from_row(result[0])
+            logger.info("Successfully created session with ID: %s", created_session.id)
             return created_session
             
         except Exception as e:
-            logger.error(f"Failed to create session: {e}")
+            logger.error("Failed to create session: %s", e)
+            raise
+    
+    async def create_many(self, sessions_data: List[dict]) -> List[SessionRecord]:
+        """
+        Create multiple session records in a single round-trip.
+        
+        The rows are sent as one JSONB array and expanded server-side with
+        jsonb_populate_recordset, which takes column types from the table,
+        so the insert, parse/plan and RETURNING cost are paid once per batch.
+        
+        Args:
+            sessions_data: List of dictionaries containing session data
+            
+        Returns:
+            Created SessionRecords
+            
+        Raises:
+            Exception: If database operation fails
+        """
+        if not sessions_data:
+            return []
+        
+        try:
+            logger.debug("Creating %s session records", len(sessions_data))
+            
+            rows = [
+                {
+                    "speech": data.get('speech'),
+                    "questions": data.get('questions') or None,
+                    "created_by": data.get('created_by'),
+                    "generated_by": data.get('generated_by'),
+                    "created_at": data.get('created_at'),
+                    "audio": data.get('audio'),
+                    "original_paper": data.get('original_paper')
+                }
+                for data in sessions_data
+            ]
+            
+            columns = "speech, questions, created_by, generated_by, created_at, audio, original_paper"
+            query = f"""
+                INSERT INTO {self.table_name} ({columns})
+                SELECT speech, questions, created_by, generated_by,
+                       COALESCE(created_at, now()), audio, original_paper
+                FROM jsonb_populate_recordset(NULL::{self.table_name}, $1::jsonb)
+                RETURNING *
+            """
+            
+            result = await self.db_client.execute_query(query, rows)
+            
+            created_sessions = [_record_from_row(row) for row in result]
+            logger.info("Successfully created %s sessions", len(created_sessions))
+            return created_sessions
+            
+        except Exception as e:
+            logger.error("Failed to create sessions: %s", e)
             raise
     
     async def delete(self, session_id: int) -> bool:
@@ -159,20 +209,20 @@ class SessionRepository:
             Exception: If database operation fails
         """
         try:
-            logger.debug(f"Deleting session with ID: {session_id}")
+            logger.debug("Deleting session with ID: %s", session_id)
             
             query = f"DELETE FROM {self.table_name} WHERE id = $1"
             result = await self.db_client.execute_command(query, session_id)
             
             if result == "DELETE 0":
-                logger.warning(f"No session found to delete with ID: {session_id}")
+                logger.warning("No session found to delete with ID: %s", session_id)
                 return False
             
-            logger.info(f"Successfully deleted session: {session_id}")
+            logger.info("Successfully deleted session: %s", session_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to delete session {session_id}: {e}")
+            logger.error("Failed to delete session %s: %s", session_id, e)
             raise
     
     async def list_sessions(self, limit: int = 100, offset: int = 0) -> List[SessionRecord]:
@@ -190,7 +240,7 @@ class SessionRepository:
             Exception: If database operation fails
         """
         try:
-            logger.debug(f"Listing sessions with limit: {limit}, offset: {offset}")
+            logger.debug("Listing sessions with limit: %s, offset: %s", limit, offset)
             
             query = f"""
                 SELECT * FROM {self.table_name}
@@ -200,19 +250,13 @@ class SessionRepository:
             
             result = await self.db_client.execute_query(query, limit, offset)
             
-            sessions = []
-            for row in result:
-                session_data = dict(row)
-                # Handle JSONB fields
-                if session_data.get('questions') and isinstance(session_data['questions'], str):
-                    session_data['questions'] = json.loads(session_data['questions'])
-                sessions.append(SessionRecord(**session_data))
+            sessions = [_record_from_row(row) for row in result]
             
-            logger.debug(f"Retrieved {len(sessions)} sessions")
+            logger.debug("Retrieved %s sessions", len(sessions))
             return sessions
             
         except Exception as e:
-            logger.error(f"Failed to list sessions: {e}")
+            logger.error("Failed to list sessions: %s", e)
             raise
     
     async def exists(self, session_id: int) -> bool:
@@ -229,15 +273,14 @@ class SessionRepository:
             Exception: If database operation fails
         """
         try:
-            logger.debug(f"Checking if session exists: {session_id}")
+            logger.debug("Checking if session exists: %s", session_id)
             
-            query = f"SELECT 1 FROM {self.table_name} WHERE id = $1 LIMIT 1"
-            result = await self.db_client.execute_query(query, session_id)
+            query = f"SELECT EXISTS(SELECT 1 FROM {self.table_name} WHERE id = $1)"
+            exists = bool(await self.db_client.execute_fetchval(query, session_id))
             
-            exists = len(result) > 0
-            logger.debug(f"Session {session_id} exists: {exists}")
+            logger.debug("Session %s exists: %s", session_id, exists)
             return exists
             
         except Exception as e:
-            logger.error(f"Failed to check session existence {session_id}: {e}")
+            logger.error("Failed to check session existence %s: %s", session_id, e)
             raise
\ No newline at end of file
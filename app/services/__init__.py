@@ -1,12 +1,37 @@
 # Business logic services
+from typing import TYPE_CHECKING
+
 from .session_service import SessionService
 from .health_service import HealthService
-from .audio_service import AudioService
-from .embedding_service import EmbeddingService, EmbeddingResult
-from .similarity_service import SimilarityService, SimilarityResult
+
+if TYPE_CHECKING:
+    from .audio_service import AudioService
+    from .embedding_service import EmbeddingService, EmbeddingResult
+    from .similarity_service import SimilarityService, SimilarityResult
+
+# Services that pull in openai, pydub or numpy are imported on first access
+# so importing the package (and the app) stays light
+_LAZY_EXPORTS = {
+    "AudioService": ".audio_service",
+    "EmbeddingService": ".embedding_service",
+    "EmbeddingResult": ".embedding_service",
+    "SimilarityService": ".similarity_service",
+    "SimilarityResult": ".similarity_service",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
-    "SessionService", 
+    "SessionService",
     "HealthService",
     "AudioService",
     "EmbeddingService",
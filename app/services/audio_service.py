@@ -1,17 +1,22 @@
 """
 Audio processing and transcription service using OpenAI Whisper.
 """
-import base64
 from app.core.logging_config import get_logger
 import os
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
 import openai
 
+# SIMD-accelerated base64 when available; same API as the stdlib module
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 # Handle pydub import gracefully for Python 3.13 compatibility
 try:
     from pydub import AudioSegment
@@ -87,70 +92,88 @@ class AudioService:
             except Exception as e:
                 raise AudioValidationError(f"Invalid base64 encoding: {str(e)}")
             
-            # Check file size
-            if len(audio_bytes) > self.max_file_size:
-                raise AudioValidationError(
-                    f"Audio file too large: {len(audio_bytes)} bytes "
-                    f"(max: {self.max_file_size} bytes)"
-                )
+            audio_format, channels = await self._validate_audio_bytes(audio_bytes)
+            
+            return AudioData(
+                base64_content=base64_audio,
+                format=audio_format,
+                channels=channels
+            )
             
-            if len(audio_bytes) < 44:  # Minimum WAV header size
-                raise AudioValidationError("Audio data too small to be a valid audio file")
+        except (AudioValidationError, AudioProcessingError):
+            raise
+        except Exception as e:
+            logger.error("Unexpected error decoding audio: %s", e)
+            raise AudioProcessingError(f"Failed to decode audio data: {str(e)}")
+    
+    async def _validate_audio_bytes(self, audio_bytes: bytes) -> Tuple[str, int]:
+        """
+        Validate raw audio bytes and detect their format.
+        
+        Args:
+            audio_bytes: Raw audio file bytes
             
-            # Detect format by examining the header
-            audio_format = self._detect_audio_format(audio_bytes)
+        Returns:
+            Tuple of (audio format, channel count)
             
-            # Validate format is supported
-            if audio_format not in self.supported_formats:
-                raise AudioValidationError(
-                    f"Unsupported audio format: {audio_format}. "
-                    f"Supported formats: {', '.join(self.supported_formats)}"
+        Raises:
+            AudioValidationError: If audio data is invalid
+            AudioProcessingError: If audio processing fails
+        """
+        # Check file size
+        if len(audio_bytes) > self.max_file_size:
+            raise AudioValidationError(
+                f"Audio file too large: {len(audio_bytes)} bytes "
+                f"(max: {self.max_file_size} bytes)"
+            )
+        
+        if len(audio_bytes) < 44:  # Minimum WAV header size
+            raise AudioValidationError("Audio data too small to be a valid audio file")
+        
+        # Detect format by examining the header
+        audio_format = self._detect_audio_format(audio_bytes)
+        
+        # Validate format is supported
+        if audio_format not in self.supported_formats:
+            raise AudioValidationError(
+                f"Unsupported audio format: {audio_format}. "
+                f"Supported formats: {', '.join(self.supported_formats)}"
+            )
+        
+        # Create temporary file to validate with pydub
+        with tempfile.NamedTemporaryFile(suffix=f'.{audio_format}', delete=False) as temp_file:
+            temp_file.write(audio_bytes)
+            temp_path = temp_file.name
+        
+        try:
+            if PYDUB_AVAILABLE:
+                # Validate audio file with pydub
+                audio_segment = await asyncio.get_event_loop().run_in_executor(
+                    self.executor, AudioSegment.from_file, temp_path
                 )
+                channels = audio_segment.channels
+            else:
+                # Fallback: assume mono for basic validation
+                channels = 1
+                logger.warning("pydub not available, assuming mono audio")
             
-            # Create temporary file to validate with pydub
-            with tempfile.NamedTemporaryFile(suffix=f'.{audio_format}', delete=False) as temp_file:
-                temp_file.write(audio_bytes)
-                temp_path = temp_file.name
+            logger.info(
+                "Successfully decoded audio: format=%s, channels=%s, size=%s bytes",
+                audio_format, channels, len(audio_bytes)
+            )
             
-            try:
-                if PYDUB_AVAILABLE:
-                    # Validate audio file with pydub
-                    audio_segment = await asyncio.get_event_loop().run_in_executor(
-                        self.executor, AudioSegment.from_file, temp_path
-                    )
-                    channels = audio_segment.channels
-                else:
-                    # Fallback: assume mono for basic validation
-                    channels = 1
-                    logger.warning("pydub not available, assuming mono audio")
-                
-                logger.info(
-                    f"Successfully decoded audio: format={audio_format}, "
-                    f"channels={channels}, size={len(audio_bytes)} bytes"
-                )
-                
-                return AudioData(
-                    base64_content=base64_audio,
-                    format=audio_format,
-                    channels=channels
-                )
-                
-            except CouldntDecodeError as e:
-                raise AudioValidationError(f"Invalid or corrupted audio file: {str(e)}")
-            except Exception as e:
-                raise AudioProcessingError(f"Failed to process audio file: {str(e)}")
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_path)
-                except OSError:
-                    pass
-                    
-        except (AudioValidationError, AudioProcessingError):
-            raise
+            return audio_format, channels
+            
+        except CouldntDecodeError as e:
+            raise AudioValidationError(f"Invalid or corrupted audio file: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error decoding audio: {e}")
-            raise AudioProcessingError(f"Failed to decode audio data: {str(e)}")
+            raise AudioProcessingError(f"Failed to process audio file: {str(e)}")
+        finally:
+            # Clean up temporary file
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
     
     def _detect_audio_format(self, audio_bytes: bytes) -> str:
         """
@@ -189,29 +212,46 @@ class AudioService:
         Returns:
             TranscriptionResult with transcribed text
             
+        Raises:
+            TranscriptionError: If transcription fails
+            AudioProcessingError: If audio processing fails
+        """
+        # Decode base64 to bytes
+        audio_bytes = base64.b64decode(audio_data.base64_content)
+        return await self._transcribe_bytes(audio_bytes, audio_data.format, audio_data.channels)
+    
+    async def _transcribe_bytes(self, audio_bytes: bytes, audio_format: str, channels: int) -> TranscriptionResult:
+        """
+        Transcribe raw audio bytes using OpenAI Whisper.
+        
+        Args:
+            audio_bytes: Raw audio file bytes
+            audio_format: Detected audio format
+            channels: Number of audio channels
+            
+        Returns:
+            TranscriptionResult with transcribed text
+            
         Raises:
             TranscriptionError: If transcription fails
             AudioProcessingError: If audio processing fails
         """
         temp_path = None
         try:
-            logger.info(f"Starting transcription for {audio_data.format} audio")
-            
-            # Decode base64 to bytes
-            audio_bytes = base64.b64decode(audio_data.base64_content)
+            logger.info("Starting transcription for %s audio", audio_format)
             
             # Create temporary file for Whisper API
             with tempfile.NamedTemporaryFile(
-                suffix=f'.{audio_data.format}', 
+                suffix=f'.{audio_format}', 
                 delete=False
             ) as temp_file:
                 temp_file.write(audio_bytes)
                 temp_path = temp_file.name
             
             # Convert to mono WAV if needed for better Whisper performance
-            if PYDUB_AVAILABLE and (audio_data.channels > 1 or audio_data.format != 'wav'):
-                temp_path = await self._convert_to_mono_wav(temp_path, audio_data.format)
-            elif not PYDUB_AVAILABLE and audio_data.format != 'wav':
+            if PYDUB_AVAILABLE and (channels > 1 or audio_format != 'wav'):
+                temp_path = await self._convert_to_mono_wav(temp_path, audio_format)
+            elif not PYDUB_AVAILABLE and audio_format != 'wav':
                 logger.warning("pydub not available, cannot convert audio format - using original file")
             
             # Transcribe with OpenAI Whisper
@@ -238,8 +278,8 @@ class AudioService:
             confidence = None
             
             logger.info(
-                f"Transcription successful: {len(transcribed_text)} characters, "
-                f"language: {language}"
+                "Transcription successful: %s characters, language: %s",
+                len(transcribed_text), language
             )
             
             return TranscriptionResult(
@@ -251,16 +291,16 @@ class AudioService:
         except TranscriptionError:
             raise
         except openai.APIError as e:
-            logger.error(f"OpenAI API error during transcription: {e}")
+            logger.error("OpenAI API error during transcription: %s", e)
             raise WhisperError(f"OpenAI API error: {str(e)}", {"error_type": "api_error"})
         except openai.RateLimitError as e:
-            logger.error(f"OpenAI rate limit exceeded: {e}")
+            logger.error("OpenAI rate limit exceeded: %s", e)
             raise RateLimitError("openai", retry_after=getattr(e, 'retry_after', None))
         except openai.APIConnectionError as e:
-            logger.error(f"OpenAI connection error: {e}")
+            logger.error("OpenAI connection error: %s", e)
             raise WhisperError("Failed to connect to transcription service", {"error_type": "connection_error"})
         except Exception as e:
-            logger.error(f"Unexpected error during transcription: {e}")
+            logger.error("Unexpected error during transcription: %s", e)
             raise TranscriptionError(f"Transcription failed: {str(e)}")
         finally:
             # Clean up temporary files
@@ -288,7 +328,7 @@ class AudioService:
             raise AudioProcessingError("Audio conversion not available - pydub not installed")
             
         try:
-            logger.info(f"Converting {input_format} to mono WAV")
+            logger.info("Converting %s to mono WAV", input_format)
             
             # Load audio with pydub
             audio = await asyncio.get_event_loop().run_in_executor(
@@ -319,7 +359,7 @@ class AudioService:
             return output_path
             
         except Exception as e:
-            logger.error(f"Failed to convert audio to mono WAV: {e}")
+            logger.error("Failed to convert audio to mono WAV: %s", e)
             raise AudioProcessingError(f"Audio conversion failed: {str(e)}")
     
     async def process_and_transcribe(self, base64_audio: str) -> TranscriptionResult:
@@ -352,7 +392,37 @@ class AudioService:
         except (AudioValidationError, AudioProcessingError, TranscriptionError):
             raise
         except Exception as e:
-            logger.error(f"Unexpected error in processing pipeline: {e}")
+            logger.error("Unexpected error in processing pipeline: %s", e)
+            raise AudioProcessingError(f"Processing pipeline failed: {str(e)}")
+    
+    async def process_and_transcribe_bytes(self, audio_bytes: bytes) -> TranscriptionResult:
+        """
+        Complete pipeline for raw (uploaded) audio bytes: validate and transcribe.
+        
+        Args:
+            audio_bytes: Raw audio file bytes
+            
+        Returns:
+            TranscriptionResult with transcribed text
+            
+        Raises:
+            AudioValidationError: If audio validation fails
+            AudioProcessingError: If audio processing fails
+            TranscriptionError: If transcription fails
+        """
+        try:
+            logger.info("Starting audio processing and transcription pipeline for uploaded audio")
+            
+            audio_format, channels = await self._validate_audio_bytes(audio_bytes)
+            result = await self._transcribe_bytes(audio_bytes, audio_format, channels)
+            
+            logger.info("Audio processing and transcription pipeline completed successfully")
+            return result
+            
+        except (AudioValidationError, AudioProcessingError, TranscriptionError):
+            raise
+        except Exception as e:
+            logger.error("Unexpected error in processing pipeline: %s", e)
             raise AudioProcessingError(f"Processing pipeline failed: {str(e)}")
     
     def __del__(self):
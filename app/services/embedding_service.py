@@ -2,7 +2,9 @@
 Embedding service for text vectorization using OpenAI embeddings API.
 """
 import asyncio
-from typing import List, Dict, Any, Optional
+import hashlib
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Union
 from app.core.logging_config import get_logger
 from openai import AsyncOpenAI
 import numpy as np
@@ -16,18 +18,90 @@ from app.core.exceptions import (
 
 logger = get_logger(__name__)
 
+# Reference text embeddings shared across requests, keyed by model + text digest
+# and stored int8-quantized to keep the cache compact
+REFERENCE_CACHE_MAXSIZE = 1024
+_reference_embedding_cache: "OrderedDict[str, QuantizedEmbedding]" = OrderedDict()
+
+
+def _reference_cache_key(model: str, text: str) -> str:
+    """Build a compact cache key for a reference text."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{model}:{digest}"
+
 
 class EmbeddingResult:
-    """Container for embedding results."""
+    """
+    Container for embedding results.
+    
+    The vector is stored as a contiguous float32 array from the start, so
+    the list of Python floats returned by the API is released immediately
+    and the similarity step can use it without another conversion.
+    """
     
-    def __init__(self, vector: List[float], model: str, usage_tokens: int):
-        self.vector = vector
+    def __init__(
+        self,
+        vector: Union[List[float], np.ndarray],
+        model: str,
+        usage_tokens: int,
+        norm: Optional[np.floating] = None
+    ):
+        self.vector = np.ascontiguousarray(vector, dtype=np.float32)
         self.model = model
         self.usage_tokens = usage_tokens
+        self._norm = norm
         
     def to_numpy(self) -> np.ndarray:
-        """Convert vector to numpy array."""
-        return np.array(self.vector)
+        """Return the vector as a contiguous float32 numpy array."""
+        return self.vector
+    
+    def l2_norm(self) -> np.floating:
+        """Return the vector's L2 norm (computed once, or supplied by the cache)."""
+        if self._norm is None:
+            self._norm = np.linalg.norm(self.vector)
+        return self._norm
+
+
+class QuantizedEmbedding:
+    """
+    Int8 embedding with a symmetric per-vector scale.
+    
+    Uses a quarter of the memory of a float32 vector; cosine similarity is
+    scale-invariant, so the quantization error is the only accuracy cost.
+    The norm of the dequantized vector is stored alongside it so cache hits
+    don't recompute it for every similarity calculation.
+    """
+    
+    __slots__ = ("values", "scale", "norm", "model", "usage_tokens")
+    
+    def __init__(self, values: np.ndarray, scale: float, model: str, usage_tokens: int):
+        self.values = values
+        self.scale = scale
+        self.model = model
+        self.usage_tokens = usage_tokens
+        self.norm = np.linalg.norm(self._dequantize())
+    
+    @classmethod
+    def from_result(cls, result: EmbeddingResult) -> "QuantizedEmbedding":
+        """Quantize an embedding result to int8."""
+        vector = result.to_numpy()
+        max_abs = float(np.max(np.abs(vector))) if vector.size else 0.0
+        scale = max_abs / 127.0 if max_abs > 0.0 else 1.0
+        values = np.round(vector / scale).astype(np.int8)
+        return cls(values, scale, result.model, result.usage_tokens)
+    
+    def _dequantize(self) -> np.ndarray:
+        """Rebuild the float32 vector from the int8 values."""
+        return self.values.astype(np.float32) * np.float32(self.scale)
+    
+    def to_result(self) -> EmbeddingResult:
+        """Dequantize into a float32 embedding result."""
+        return EmbeddingResult(
+            vector=self._dequantize(),
+            model=self.model,
+            usage_tokens=self.usage_tokens,
+            norm=self.norm
+        )
 
 
 class EmbeddingService:
@@ -62,10 +136,10 @@ class EmbeddingService:
         # Truncate text if too long (rough estimate: 1 token ≈ 4 characters)
         if len(text) > self.max_tokens * 4:
             text = text[:self.max_tokens * 4]
-            logger.warning(f"Text truncated to {self.max_tokens * 4} characters")
+            logger.warning("Text truncated to %s characters", self.max_tokens * 4)
             
         try:
-            logger.debug(f"Generating embedding for text of length {len(text)}")
+            logger.debug("Generating embedding for text of length %s", len(text))
             
             response = await self.client.embeddings.create(
                 model=self.model,
@@ -82,13 +156,13 @@ class EmbeddingService:
                 usage_tokens=usage.total_tokens
             )
             
-            logger.debug(f"Generated embedding with {len(result.vector)} dimensions, "
-                        f"used {result.usage_tokens} tokens")
+            logger.debug("Generated embedding with %s dimensions, used %s tokens",
+                         len(result.vector), result.usage_tokens)
             
             return result
             
         except Exception as e:
-            logger.error(f"Failed to generate embedding: {str(e)}")
+            logger.error("Failed to generate embedding: %s", e)
             # Check for rate limiting
             if "rate_limit" in str(e).lower() or "429" in str(e):
                 raise RateLimitError("openai", details={"operation": "embedding_generation"})
@@ -115,13 +189,13 @@ class EmbeddingService:
         valid_texts = []
         for i, text in enumerate(texts):
             if not text or not text.strip():
-                logger.warning(f"Skipping empty text at index {i}")
+                logger.warning("Skipping empty text at index %s", i)
                 continue
                 
             # Truncate if necessary
             if len(text) > self.max_tokens * 4:
                 text = text[:self.max_tokens * 4]
-                logger.warning(f"Text at index {i} truncated to {self.max_tokens * 4} characters")
+                logger.warning("Text at index %s truncated to %s characters", i, self.max_tokens * 4)
                 
             valid_texts.append(text)
             
@@ -129,7 +203,7 @@ class EmbeddingService:
             raise ValidationError("No valid texts found after filtering", field="texts")
             
         try:
-            logger.debug(f"Generating embeddings for {len(valid_texts)} texts")
+            logger.debug("Generating embeddings for %s texts", len(valid_texts))
             
             response = await self.client.embeddings.create(
                 model=self.model,
@@ -146,18 +220,52 @@ class EmbeddingService:
                 )
                 results.append(result)
                 
-            logger.debug(f"Generated {len(results)} embeddings, "
-                        f"total tokens used: {response.usage.total_tokens}")
+            logger.debug("Generated %s embeddings, total tokens used: %s",
+                         len(results), response.usage.total_tokens)
             
             return results
             
         except Exception as e:
-            logger.error(f"Failed to generate batch embeddings: {str(e)}")
+            logger.error("Failed to generate batch embeddings: %s", e)
             # Check for rate limiting
             if "rate_limit" in str(e).lower() or "429" in str(e):
                 raise RateLimitError("openai", details={"operation": "batch_embedding_generation"})
             raise EmbeddingError(f"OpenAI embeddings API error: {str(e)}", details={"operation": "batch_embeddings"})
     
+    async def get_reference_embedding(self, reference_text: str) -> EmbeddingResult:
+        """
+        Generate an embedding for a reference text, using a shared LRU cache.
+        
+        Reference texts are typically reused across many sessions, so their
+        embeddings are cached and only embedded on the first request.
+        
+        Args:
+            reference_text: Reference text to embed
+            
+        Returns:
+            EmbeddingResult for the reference text
+            
+        Raises:
+            EmbeddingValidationError: If text is invalid
+            EmbeddingAPIError: If OpenAI API call fails
+        """
+        key = _reference_cache_key(self.model, reference_text)
+        cached = _reference_embedding_cache.get(key)
+        
+        if cached is not None:
+            _reference_embedding_cache.move_to_end(key)
+            logger.debug("Reference embedding cache hit")
+            return cached.to_result()
+        
+        quantized = QuantizedEmbedding.from_result(await self.get_embedding(reference_text))
+        _reference_embedding_cache[key] = quantized
+        if len(_reference_embedding_cache) > REFERENCE_CACHE_MAXSIZE:
+            _reference_embedding_cache.popitem(last=False)
+        
+        # Return the dequantized vector on a miss too, so the score for a
+        # given reference doesn't depend on whether it was already cached
+        return quantized.to_result()
+    
     async def close(self):
         """Close the OpenAI client connection."""
         await self.client.close()
\ No newline at end of file
@@ -43,7 +43,7 @@ class HealthService:
             }
             
         except Exception as e:
-            logger.error(f"Database health check failed: {e}")
+            logger.error("Database health check failed: %s", e)
             return {
                 "service": "database",
                 "status": "unhealthy",
@@ -61,7 +61,7 @@ class HealthService:
         Perform comprehensive health check of all services.
         
         Returns:
-            Dictionary with overall health status
+            Dictionary with overall health status; "timestamp" is a datetime
         """
         try:
             logger.info("Performing overall health check")
@@ -75,7 +75,7 @@ class HealthService:
             
             return {
                 "status": overall_status,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.utcnow(),
                 "services": {
                     "database": db_health
                 },
@@ -87,10 +87,10 @@ class HealthService:
             }
             
         except Exception as e:
-            logger.error(f"Overall health check failed: {e}")
+            logger.error("Overall health check failed: %s", e)
             return {
                 "status": "unhealthy",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.utcnow(),
                 "error": str(e),
                 "services": {},
                 "summary": {
@@ -123,7 +123,7 @@ class HealthService:
             }
             
         except Exception as e:
-            logger.error(f"Readiness check failed: {e}")
+            logger.error("Readiness check failed: %s", e)
             return {
                 "ready": False,
                 "timestamp": datetime.utcnow().isoformat(),
@@ -2,8 +2,7 @@
 Session service layer with business logic.
 """
 from app.core.logging_config import get_logger
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Union, TYPE_CHECKING
 from app.models.database import SessionRecord
 from app.repositories.session_repository import SessionRepository
 from app.core.database import DatabaseClient
@@ -14,6 +13,9 @@ from app.core.exceptions import (
     DatabaseConnectionError
 )
 
+if TYPE_CHECKING:
+    from app.services.audio_service import AudioService
+
 logger = get_logger(__name__)
 
 
@@ -39,7 +41,7 @@ class SessionService:
             Exception: For other database errors
         """
         try:
-            logger.info(f"Getting session: {session_id}")
+            logger.info("Getting session: %s", session_id)
             
             if session_id <= 0:
                 raise SessionValidationError("Session ID must be a positive integer")
@@ -53,25 +55,31 @@ class SessionService:
             if not session.audio or not session.audio.strip():
                 raise SessionValidationError(f"Session {session_id} has no transcribed text data", {"session_id": session_id})
             
-            logger.info(f"Successfully retrieved session: {session_id}")
+            logger.info("Successfully retrieved session: %s", session_id)
             return session
             
         except (SessionNotFoundError, SessionValidationError):
             raise
         except Exception as e:
-            logger.error(f"Failed to get session {session_id}: {e}")
+            logger.error("Failed to get session %s: %s", session_id, e)
             # Wrap database errors
             if "connection" in str(e).lower() or "timeout" in str(e).lower():
                 raise DatabaseConnectionError(str(e), {"session_id": session_id})
             raise DatabaseError(str(e), {"session_id": session_id})
     
-    async def update_session_with_audio_transcription(self, session_id: int, audio_data: str) -> SessionRecord:
+    async def update_session_with_audio_transcription(
+        self,
+        session_id: int,
+        audio_data: Union[str, bytes],
+        audio_service: Optional["AudioService"] = None
+    ) -> SessionRecord:
         """
         Transcribe audio and update session with the transcribed text.
         
         Args:
             session_id: The session ID to update
-            audio_data: Base64 encoded audio data
+            audio_data: Raw uploaded audio bytes or base64 encoded audio data
+            audio_service: Shared audio service (a new one is created if omitted)
             
         Returns:
             Updated SessionRecord
@@ -82,12 +90,12 @@ class SessionService:
             Exception: For other database errors
         """
         try:
-            logger.info(f"Transcribing audio and updating session: {session_id}")
+            logger.info("Transcribing audio and updating session: %s", session_id)
             
             if session_id <= 0:
                 raise SessionValidationError("Session ID must be a positive integer")
             
-            if not audio_data or not audio_data.strip():
+            if not audio_data or (isinstance(audio_data, str) and not audio_data.strip()):
                 raise SessionValidationError("Audio data cannot be empty")
             
             # Check if session exists first
@@ -95,12 +103,16 @@ class SessionService:
                 raise SessionNotFoundError(session_id)
             
             # Transcribe the audio using AudioService
-            from app.services.audio_service import AudioService
-            audio_service = AudioService()
-            transcription_result = await audio_service.process_and_transcribe(audio_data.strip())
+            if audio_service is None:
+                from app.services.audio_service import AudioService
+                audio_service = AudioService()
+            if isinstance(audio_data, bytes):
+                transcription_result = await audio_service.process_and_transcribe_bytes(audio_data)
+            else:
+                transcription_result = await audio_service.process_and_transcribe(audio_data.strip())
             transcribed_text = transcription_result.text
             
-            logger.info(f"Audio transcribed successfully for session {session_id}")
+            logger.info("Audio transcribed successfully for session %s", session_id)
             
             # Update the session with transcribed text
             success = await self.repository.update_speech(session_id, transcribed_text)
@@ -111,24 +123,30 @@ class SessionService:
             # Return updated session
             updated_session = await self.repository.get_by_id(session_id)
             
-            logger.info(f"Successfully transcribed and updated session: {session_id}")
+            logger.info("Successfully transcribed and updated session: %s", session_id)
             return updated_session
             
         except (SessionNotFoundError, SessionValidationError):
             raise
         except Exception as e:
-            logger.error(f"Failed to transcribe and update session {session_id}: {e}")
+            logger.error("Failed to transcribe and update session %s: %s", session_id, e)
             # Wrap database errors
             if "connection" in str(e).lower() or "timeout" in str(e).lower():
                 raise DatabaseConnectionError(str(e), {"session_id": session_id})
             raise DatabaseError(str(e), {"session_id": session_id})
     
-    async def create_session_with_audio(self, audio_data: str, **kwargs) -> SessionRecord:
+    async def create_session_with_audio(
+        self,
+        audio_data: str,
+        audio_service: Optional["AudioService"] = None,
+        **kwargs
+    ) -> SessionRecord:
         """
         Create a new session by transcribing audio data.
         
         Args:
             audio_data: Base64 encoded audio data
+            audio_service: Shared audio service (a new one is created if omitted)
             **kwargs: Additional session data (created_by, generated_by, etc.)
             
         Returns:
@@ -146,8 +164,9 @@ class SessionService:
                 raise SessionValidationError("Audio data is required for session creation")
             
             # Transcribe the audio using AudioService
-            from app.services.audio_service import AudioService
-            audio_service = AudioService()
+            if audio_service is None:
+                from app.services.audio_service import AudioService
+                audio_service = AudioService()
             transcription_result = await audio_service.process_and_transcribe(audio_data.strip())
             transcribed_text = transcription_result.text
             
@@ -156,19 +175,18 @@ class SessionService:
             # Prepare session data
             session_data = {
                 "audio": transcribed_text,  # Store transcribed text in audio column
-                "created_at": datetime.utcnow(),
                 **kwargs  # Include any additional data like created_by, generated_by, questions
             }
             
             created_session = await self.repository.create(session_data)
             
-            logger.info(f"Successfully created session: {created_session.id}")
+            logger.info("Successfully created session: %s", created_session.id)
             return created_session
             
         except SessionValidationError:
             raise
         except Exception as e:
-            logger.error(f"Failed to create session: {e}")
+            logger.error("Failed to create session: %s", e)
             raise
     
     async def delete_session(self, session_id: int) -> bool:
@@ -187,7 +205,7 @@ class SessionService:
             Exception: For other database errors
         """
         try:
-            logger.info(f"Deleting session: {session_id}")
+            logger.info("Deleting session: %s", session_id)
             
             if session_id <= 0:
                 raise SessionValidationError("Session ID must be a positive integer")
@@ -199,14 +217,14 @@ class SessionService:
             success = await self.repository.delete(session_id)
             
             if success:
-                logger.info(f"Successfully deleted session: {session_id}")
+                logger.info("Successfully deleted session: %s", session_id)
             
             return success
             
         except (SessionNotFoundError, SessionValidationError):
             raise
         except Exception as e:
-            logger.error(f"Failed to delete session {session_id}: {e}")
+            logger.error("Failed to delete session %s: %s", session_id, e)
             raise
     
     async def list_sessions(self, limit: int = 100, offset: int = 0) -> List[SessionRecord]:
@@ -225,7 +243,7 @@ class SessionService:
             Exception: For database errors
         """
         try:
-            logger.info(f"Listing sessions with limit: {limit}, offset: {offset}")
+            logger.info("Listing sessions with limit: %s, offset: %s", limit, offset)
             
             # Validate pagination parameters
             if limit <= 0 or limit > 1000:
@@ -236,13 +254,13 @@ class SessionService:
             
             sessions = await self.repository.list_sessions(limit, offset)
             
-            logger.info(f"Successfully retrieved {len(sessions)} sessions")
+            logger.info("Successfully retrieved %s sessions", len(sessions))
             return sessions
             
         except SessionValidationError:
             raise
         except Exception as e:
-            logger.error(f"Failed to list sessions: {e}")
+            logger.error("Failed to list sessions: %s", e)
             raise
     
     async def session_exists(self, session_id: int) -> bool:
@@ -268,5 +286,5 @@ class SessionService:
         except SessionValidationError:
             raise
         except Exception as e:
-            logger.error(f"Failed to check session existence {session_id}: {e}")
+            logger.error("Failed to check session existence %s: %s", session_id, e)
             raise
\ No newline at end of file
@@ -2,14 +2,16 @@
 Similarity service for calculating vector similarity scores.
 """
 from app.core.logging_config import get_logger
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 import numpy as np
-from scipy.spatial.distance import cosine
 
 from app.core.exceptions import SimilarityError, ValidationError
 
 logger = get_logger(__name__)
 
+# Embedding vectors may be plain lists or (preferably) float32 arrays
+Vector = Union[List[float], np.ndarray]
+
 
 class SimilarityResult:
     """Container for similarity calculation results."""
@@ -29,44 +31,55 @@ class SimilarityService:
     
     def calculate_cosine_similarity(
         self, 
-        vector1: List[float], 
-        vector2: List[float]
+        vector1: Vector, 
+        vector2: Vector,
+        norm1: Optional[float] = None,
+        norm2: Optional[float] = None
     ) -> float:
         """
         Calculate cosine similarity between two vectors.
         
+        Vectors are coerced to contiguous float32 arrays (a no-op for arrays
+        that already are) so the dot product and norms run in BLAS.
+        
         Args:
             vector1: First embedding vector
             vector2: Second embedding vector
+            norm1: Precomputed L2 norm of vector1, if known
+            norm2: Precomputed L2 norm of vector2, if known
             
         Returns:
             Cosine similarity score between -1 and 1
             
         Raises:
             SimilarityValidationError: If vectors are invalid or incompatible
+            SimilarityError: If vectors can't be converted or calculation fails
         """
-        if not vector1 or not vector2:
-            raise ValidationError("Vectors cannot be empty", field="vectors")
-            
-        if len(vector1) != len(vector2):
-            raise ValidationError(
-                f"Vector dimensions must match: {len(vector1)} vs {len(vector2)}",
-                field="vector_dimensions",
-                details={"vector1_dim": len(vector1), "vector2_dim": len(vector2)}
-            )
-            
         try:
-            # Convert to numpy arrays
-            arr1 = np.array(vector1, dtype=np.float64)
-            arr2 = np.array(vector2, dtype=np.float64)
+            arr1 = np.ascontiguousarray(vector1, dtype=np.float32)
+            arr2 = np.ascontiguousarray(vector2, dtype=np.float32)
+            
+            if arr1.size == 0 or arr2.size == 0:
+                raise ValidationError("Vectors cannot be empty", field="vectors")
+                
+            if arr1.shape != arr2.shape:
+                raise ValidationError(
+                    f"Vector dimensions must match: {arr1.size} vs {arr2.size}",
+                    field="vector_dimensions",
+                    details={"vector1_dim": arr1.size, "vector2_dim": arr2.size}
+                )
+                
+            if norm1 is None:
+                norm1 = np.linalg.norm(arr1)
+            if norm2 is None:
+                norm2 = np.linalg.norm(arr2)
             
             # Check for zero vectors
-            if np.allclose(arr1, 0) or np.allclose(arr2, 0):
+            if norm1 == 0.0 or norm2 == 0.0:
                 logger.warning("One or both vectors are zero vectors")
                 return 0.0
                 
-            # Calculate cosine similarity (1 - cosine distance)
-            similarity = 1 - cosine(arr1, arr2)
+            similarity = float(arr1 @ arr2) / float(norm1 * norm2)
             
             # Handle potential numerical issues
             if np.isnan(similarity):
@@ -74,13 +87,15 @@ class SimilarityService:
                 return 0.0
                 
             # Clamp to valid range [-1, 1]
-            similarity = np.clip(similarity, -1.0, 1.0)
+            similarity = min(max(similarity, -1.0), 1.0)
             
-            logger.debug(f"Calculated cosine similarity: {similarity}")
-            return float(similarity)
+            logger.debug("Calculated cosine similarity: %s", similarity)
+            return similarity
             
+        except ValidationError:
+            raise
         except Exception as e:
-            logger.error(f"Failed to calculate cosine similarity: {str(e)}")
+            logger.error("Failed to calculate cosine similarity: %s", e)
             raise SimilarityError(f"Similarity calculation error: {str(e)}") from e
     
     def normalize_similarity_score(self, cosine_score: float) -> float:
@@ -124,8 +139,10 @@ class SimilarityService:
     
     def calculate_similarity(
         self, 
-        vector1: List[float], 
-        vector2: List[float]
+        vector1: Vector, 
+        vector2: Vector,
+        norm1: Optional[float] = None,
+        norm2: Optional[float] = None
     ) -> SimilarityResult:
         """
         Calculate complete similarity analysis between two vectors.
@@ -133,6 +150,8 @@ class SimilarityService:
         Args:
             vector1: First embedding vector
             vector2: Second embedding vector
+            norm1: Precomputed L2 norm of vector1, if known
+            norm2: Precomputed L2 norm of vector2, if known
             
         Returns:
             SimilarityResult with score, normalized score, and interpretation
@@ -142,7 +161,7 @@ class SimilarityService:
             SimilarityError: If calculation fails
         """
         # Calculate raw cosine similarity
-        cosine_score = self.calculate_cosine_similarity(vector1, vector2)
+        cosine_score = self.calculate_cosine_similarity(vector1, vector2, norm1, norm2)
         
         # Normalize to 0-1 range
         normalized_score = self.normalize_similarity_score(cosine_score)
@@ -150,9 +169,8 @@ class SimilarityService:
         # Get interpretation
         interpretation = self.interpret_similarity_score(normalized_score)
         
-        logger.debug(f"Similarity analysis - Raw: {cosine_score:.4f}, "
-                    f"Normalized: {normalized_score:.4f}, "
-                    f"Interpretation: {interpretation}")
+        logger.debug("Similarity analysis - Raw: %.4f, Normalized: %.4f, Interpretation: %s",
+                     cosine_score, normalized_score, interpretation)
         
         return SimilarityResult(
             score=cosine_score,
@@ -162,8 +180,8 @@ class SimilarityService:
     
     def calculate_batch_similarities(
         self, 
-        reference_vector: List[float], 
-        comparison_vectors: List[List[float]]
+        reference_vector: Vector, 
+        comparison_vectors: List[Vector]
     ) -> List[SimilarityResult]:
         """
         Calculate similarities between a reference vector and multiple comparison vectors.
@@ -187,7 +205,7 @@ class SimilarityService:
                 result = self.calculate_similarity(reference_vector, comparison_vector)
                 results.append(result)
             except Exception as e:
-                logger.error(f"Failed to calculate similarity for vector {i}: {str(e)}")
+                logger.error("Failed to calculate similarity for vector %s: %s", i, e)
                 # Add a zero similarity result for failed calculations
                 results.append(SimilarityResult(
                     score=0.0,
@@ -195,5 +213,5 @@ class SimilarityService:
                     interpretation="Calculation Failed"
                 ))
                 
-        logger.debug(f"Calculated {len(results)} similarity scores")
+        logger.debug("Calculated %s similarity scores", len(results))
         return results
\ No newline at end of file
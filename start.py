@@ -2,6 +2,7 @@
 """
 Production startup script for Render deployment.
 """
+import importlib.util
 import os
 import uvicorn
 
@@ -9,11 +10,17 @@ if __name__ == "__main__":
     # Get port from environment (Render sets this)
     port = int(os.environ.get("PORT", 8000))
     
+    # Prefer the libuv-backed event loop and C HTTP parser when installed
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    
     # Run the application
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=port,
+        loop=loop,
+        http=http,
         log_level="info",
         access_log=True
     )
\ No newline at end of file
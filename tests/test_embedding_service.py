@@ -0,0 +1,40 @@
+"""
+Tests for the reference embedding cache in EmbeddingService.
+"""
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.services import embedding_service as embedding_module
+from app.services.embedding_service import EmbeddingResult, EmbeddingService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """EmbeddingService whose API call returns a fixed vector."""
+    embedding_module._reference_embedding_cache.clear()
+    
+    service = EmbeddingService()
+    calls = []
+    
+    async def fake_get_embedding(text: str) -> EmbeddingResult:
+        calls.append(text)
+        rng = np.random.default_rng(0)
+        return EmbeddingResult(vector=rng.standard_normal(1536).tolist(), model=service.model, usage_tokens=7)
+    
+    monkeypatch.setattr(service, "get_embedding", fake_get_embedding)
+    service.calls = calls
+    yield service
+    embedding_module._reference_embedding_cache.clear()
+
+
+def test_reference_embedding_miss_and_hit_return_identical_vectors(service):
+    """A cache miss must return the same vector as the hits that follow it."""
+    miss = asyncio.run(service.get_reference_embedding("reference text"))
+    hit = asyncio.run(service.get_reference_embedding("reference text"))
+    
+    assert service.calls == ["reference text"]
+    assert miss.to_numpy().dtype == np.float32
+    np.testing.assert_array_equal(miss.to_numpy(), hit.to_numpy())
+    assert miss.usage_tokens == hit.usage_tokens